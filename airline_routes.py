@@ -9,7 +9,7 @@ Modelagem:
 from typing import List
 import matplotlib.pyplot as plt
 import networkx as nx
-from main import Graph, get_vertices_num, get_edge_num
+from main import Graph, get_vertices_num, get_edge_num, caminho_bidirecional, caminhos_simples, ciclos_simples
 from vehicle_parts import graus
 
 # ==================== DATASET ====================
@@ -102,6 +102,63 @@ def analisar_subgrafo(g_projetado: Graph, vertices_subgrafo: List[str]):
     print(f"|V_sub| = {n_sub}, |E_sub| = {m_sub}")
 
 
+def rota_mais_curta(g_projetado: Graph, origem: str, destino: str) -> List[str]:
+    """
+    Encontrar a rota com o menor número de trechos entre dois aeródromos (BFS bidirecional).
+    """
+    rota = caminho_bidirecional(origem, destino, g=g_projetado)
+    if rota is None:
+        print(f"Não existe rota entre {origem} e {destino}")
+    else:
+        print(f"{origem} -> {destino} ({len(rota) - 1} trechos): {' -> '.join(rota)}")
+    return rota
+
+def rotas(g_projetado: Graph):
+    """
+    Consultar as rotas com menos conexões entre alguns pares de aeródromos.
+    """
+    print("\n" + "-"*80)
+    print("Rotas com o menor número de trechos")
+    rota_mais_curta(g_projetado, 'SBPK', 'VOHY')   # Pelotas -> Hyderabad(Índia)
+    rota_mais_curta(g_projetado, 'SBJA', 'KBOS')   # Jaguaruna -> Boston(Estados Unidos)
+    rota_mais_curta(g_projetado, 'SAME', 'LMML')   # Mendoza(Argentina) -> Malta
+
+    print("\n" + "-"*80)
+    print("Itinerários alternativos")
+    itinerarios(g_projetado, 'SBPK', 'SBJA')   # Pelotas -> Jaguaruna
+    itinerarios(g_projetado, 'SAME', 'LMML', max_trechos=4)   # Mendoza(Argentina) -> Malta
+
+def itinerarios(g_projetado: Graph, origem: str, destino: str, max_trechos: int = 3, max_exibir: int = 5) -> int:
+    """
+    Enumerar os itinerários (caminhos simples) de origem até destino com até max_trechos trechos,
+    sem montar a lista completa em memória; exibe os max_exibir primeiros e retorna o total.
+    """
+    total = 0
+    for itinerario in caminhos_simples(origem, destino, g=g_projetado, max_length=max_trechos):
+        total += 1
+        if total <= max_exibir:
+            print(f"  {' -> '.join(itinerario)}")
+    print(f"{origem} -> {destino}: {total} itinerários com até {max_trechos} trechos")
+    return total
+
+def rotas_circulares(g_projetado: Graph, max_trechos: int = 4, max_exibir: int = 5):
+    """
+    Enumerar as rotas circulares (ciclos simples) com até max_trechos trechos, contando-as por
+    tamanho sem guardar todas em memória e exibindo apenas as primeiras max_exibir.
+    """
+    print("\n" + "-"*80)
+    print(f"Rotas circulares com até {max_trechos} trechos")
+    stats = {}
+    por_tamanho = {}
+    for ciclo in ciclos_simples(g=g_projetado, max_length=max_trechos, stats=stats):
+        trechos = len(ciclo) - 1
+        por_tamanho[trechos] = por_tamanho.get(trechos, 0) + 1
+        if stats['ciclos'] <= max_exibir:
+            print(f"  {' -> '.join(ciclo)}")
+    for trechos in sorted(por_tamanho):
+        print(f"{trechos} trechos: {por_tamanho[trechos]} rotas")
+    print(f"Total: {stats['ciclos']} rotas em {stats['tempo']:.3f}s ({stats['ciclos_por_segundo']:.0f} rotas/s)")
+    return por_tamanho
 
 # ==================== VISUALIZAÇÃO ====================
 def visualizar_grafo(g_projetado: Graph, salvar_como='airroute_graph.png'):
@@ -141,6 +198,8 @@ def main():
     entrada_conjuntos(g_projetado)
     graus(g_projetado)
     subgrafos(g_projetado)
+    rotas(g_projetado)
+    rotas_circulares(g_projetado)
     visualizar_grafo(g_projetado)
 
 if __name__ == '__main__':
@@ -0,0 +1,123 @@
+"""
+bitset_graph.py
+Representação de grafos pequenos e densos por máscaras de bits.
+
+Cada vértice de índice i guarda sua vizinhança como um int do Python em que o bit j
+vale 1 se existe aresta (i, j). Assim:
+- grau = popcount da máscara
+- vizinhos em comum = AND entre duas máscaras
+- verificar um mapeamento = comparar máscaras permutadas
+
+Indicado para os grafos pequenos das rotinas de isomorfismo e dos cubos coloridos.
+"""
+
+from typing import Any, Dict, List
+from main import Graph, LabelTable
+
+if hasattr(int, 'bit_count'):
+    _popcount = int.bit_count
+else:  # int.bit_count só existe a partir do Python 3.10
+    def _popcount(x: int) -> int:
+        return bin(x).count('1')
+
+
+class BitsetGraph:
+    """
+    Grafo não-direcionado com vizinhanças em máscaras de bits.
+    nodes: lista de rótulos; o vértice de índice i é nodes[i]
+    masks: lista de ints; o bit j de masks[i] indica aresta entre i e j (loop = bit i de masks[i])
+    """
+    def __init__(self, nodes: List[Any], masks: List[int] = None):
+        self.labels = LabelTable(nodes)
+        self.nodes = self.labels.labels
+        self.masks = list(masks) if masks is not None else [0] * len(self.nodes)
+        if len(self.masks) != len(self.nodes):
+            raise ValueError("masks deve ter uma máscara por vértice")
+
+    @classmethod
+    def from_graph(cls, g: Graph) -> 'BitsetGraph':
+        """Converte um main.Graph em O(n + m)."""
+        b = cls(g.nodes)
+        ids = b.labels.ids
+        masks = b.masks
+        for (u, v) in g.edges:
+            i, j = ids[u], ids[v]
+            masks[i] |= 1 << j
+            masks[j] |= 1 << i
+        return b
+
+    def to_graph(self) -> Graph:
+        """Converte de volta para main.Graph."""
+        nodes = self.nodes
+        edges = [(nodes[i], nodes[j]) for i in range(len(nodes)) for j in self.iter_bits(self.masks[i] >> i << i)]
+        return Graph(nodes, edges)
+
+    @staticmethod
+    def iter_bits(mask: int):
+        """Gera os índices dos bits ligados de mask, do menor para o maior."""
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
+    def neighbors(self, v: Any) -> List[Any]:
+        nodes = self.nodes
+        return [nodes[j] for j in self.iter_bits(self.masks[self.labels.ids[v]])]
+
+    def has_edge(self, u: Any, v: Any) -> bool:
+        ids = self.labels.ids
+        return bool(self.masks[ids[u]] >> ids[v] & 1)
+
+    def degree(self, v: Any) -> int:
+        """Grau por popcount (um loop conta duas vezes, como em main.Graph)."""
+        i = self.labels.ids[v]
+        mask = self.masks[i]
+        return _popcount(mask) + (mask >> i & 1)
+
+    def common_neighbors(self, u: Any, v: Any) -> List[Any]:
+        """Vizinhos em comum de u e v, por AND das máscaras."""
+        ids = self.labels.ids
+        nodes = self.nodes
+        return [nodes[k] for k in self.iter_bits(self.masks[ids[u]] & self.masks[ids[v]])]
+
+    def count_triangles(self) -> int:
+        """
+        Conta triângulos: para cada aresta (i, j) com i < j, conta os vizinhos comuns k > j.
+        Loops são ignorados. Complexity: O(m * n / w), w = tamanho da palavra de máquina
+        """
+        total = 0
+        masks = self.masks
+        for i, mask_i in enumerate(masks):
+            acima_i = mask_i >> (i + 1) << (i + 1)
+            for j in self.iter_bits(acima_i):
+                total += _popcount(acima_i & masks[j] >> (j + 1) << (j + 1))
+        return total
+
+    def is_isomorphism(self, other: 'BitsetGraph', mapeamento: Dict[Any, Any]) -> bool:
+        """
+        Verifica se mapeamento (rótulo em self -> rótulo em other) é um isomorfismo:
+        o mapeamento deve ser bijetor e, para todo vértice i, a vizinhança de i permutada
+        deve ser igual à vizinhança de f(i) em other. Complexity: O(n + m)
+        """
+        n = len(self.nodes)
+        if n != len(other.nodes) or len(mapeamento) != n:
+            return False
+        ids1, ids2 = self.labels.ids, other.labels.ids
+        perm = [0] * n
+        usados = 0
+        for u, v in mapeamento.items():
+            i, j = ids1.get(u), ids2.get(v)
+            if i is None or j is None or usados >> j & 1:
+                return False
+            perm[i] = j
+            usados |= 1 << j
+        for i, mask in enumerate(self.masks):
+            mapeada = 0
+            for k in self.iter_bits(mask):
+                mapeada |= 1 << perm[k]
+            if mapeada != other.masks[perm[i]]:
+                return False
+        return True
+
+    def __repr__(self):
+        return f"BitsetGraph(nodes={self.nodes})"
@@ -36,43 +36,53 @@ def build_graph(G: nx.Graph, cube: list, num: str):
                 G.add_edge(cube[i], cube[i+1], label = num)
 
 
-def is_new_subgraph(subgraphs: list, new_subgraph: nx.Graph) -> bool:
+def subgraph_mask(g: nx.Graph, bits: dict) -> int:
     """
-    Retorna se o subgrafo em questao nao esta na lista de grafos
+    Codifica as arestas rotuladas do subgrafo como uma mascara de bits (int),
+    com um bit para cada par (aresta, cubo); bits guarda o indice de cada par
     """
-    for g in subgraphs:
-        equal_edges = 0
-        for edge in g.edges:
-            if edge in new_subgraph.edges and new_subgraph[edge[0]][edge[1]]['label'] == g[edge[0]][edge[1]]['label']:
-                equal_edges += 1
-        if equal_edges == 4:
-            return False
-    return True
+    mask = 0
+    for u, v, label in g.edges(data='label'):
+        key = (frozenset((u, v)), label)
+        if key not in bits:
+            bits[key] = len(bits)
+        mask |= 1 << bits[key]
+    return mask
+
+
+def is_new_subgraph(masks: set, new_subgraph: nx.Graph, bits: dict) -> bool:
+    """
+    Retorna se o subgrafo em questao nao esta entre os subgrafos ja encontrados
+    (dois subgrafos sao iguais quando suas mascaras de arestas rotuladas sao iguais)
+    """
+    return subgraph_mask(new_subgraph, bits) not in masks
 
 
 def disj_graph(graphs: list[nx.Graph]) -> list[object]:
     """
     Retorna uma lista dos pares de grafos cujas arestas sao disjuntas
+    (AND das mascaras de arestas rotuladas igual a zero)
     """
+    bits = {}
+    masks = [subgraph_mask(g, bits) for g in graphs]
     disj_list = []
     for i in range(len(graphs)):
-        for j in range(len(graphs)):
-            if i < j:
-                disj = True
-                for edge in graphs[i].edges:
-                    if edge in graphs[j].edges and graphs[j][edge[0]][edge[1]]['label'] == graphs[i][edge[0]][edge[1]]['label']:
-                        disj = False
-                if disj == True:
-                    disj_list.append((i,j))
+        for j in range(i + 1, len(graphs)):
+            if masks[i] & masks[j] == 0:
+                disj_list.append((i,j))
     return disj_list
 
 
-def list_subgraphs(G: nx.Graph, label_arestas: list, subgraphs: list = None, cube_list: list = None, new_graph: nx.Graph = None) -> list[nx.Graph]:
+def list_subgraphs(G: nx.Graph, label_arestas: list, subgraphs: list = None, cube_list: list = None, new_graph: nx.Graph = None, masks: set = None, bits: dict = None) -> list[nx.Graph]:
     """
     Lista os subgrafos de 4 arestas entre vertices diferentes em que o grau de cada vertice eh 2
     """
     if subgraphs == None:
         subgraphs = []
+    if masks == None:
+        masks = set()
+    if bits == None:
+        bits = {}
     if cube_list == None:
         cube_list = []
     if new_graph == None:
@@ -89,9 +99,10 @@ def list_subgraphs(G: nx.Graph, label_arestas: list, subgraphs: list = None, cub
                         cube_list.append(j)
 
                         if len(cube_list) < 4:
-                            list_subgraphs(G = G, label_arestas = label_arestas, subgraphs = subgraphs, cube_list = cube_list, new_graph = new_graph)
+                            list_subgraphs(G = G, label_arestas = label_arestas, subgraphs = subgraphs, cube_list = cube_list, new_graph = new_graph, masks = masks, bits = bits)
                         elif len(cube_list) == 4:
-                            if is_new_subgraph(subgraphs, new_graph) == True:
+                            if is_new_subgraph(masks, new_graph, bits) == True:
+                                masks.add(subgraph_mask(new_graph, bits))
                                 subgraphs.append(copy.deepcopy(new_graph))
 
                         cube_list.remove(j)
@@ -0,0 +1,225 @@
+"""
+graph_binary.py
+Formato binário compacto para grafos, carregado por mapeamento de memória (mmap).
+
+Evita reprocessar a entrada de texto a cada execução: o grafo é gravado uma vez em CSR
+e reaberto como main.FrozenGraph sem copiar os vetores, que ficam no cache de páginas do
+sistema operacional e são compartilhados entre processos que abrem o mesmo arquivo.
+
+Layout do arquivo (little-endian, cada seção alinhada em 8 bytes):
+- cabeçalho (48 bytes): magic b'TGGRAPH\\0', versão (uint32), flags (uint32; bit 0 = tem pesos),
+  n (uint64), tamanho de targets (uint64), número de arestas (uint64),
+  tamanho da tabela de rótulos em bytes (uint64)
+- tabela de rótulos: lista JSON (UTF-8) com os rótulos na ordem dos ids
+- offsets: n + 1 int64
+- targets: int32, vizinhos de cada vértice ordenados
+- pesos (se flags & 1): float64 paralelo a targets, NaN = aresta sem peso
+"""
+
+from typing import Any, List
+from array import array
+import json
+import mmap
+import struct
+import sys
+from main import (
+    Graph, FrozenGraph, LabelTable,
+    adj_matrix_to_graph, incidence_matrix_to_graph, adj_list_to_graph
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: só acelera a validação dos vetores em load_graph_binary
+    np = None
+
+MAGIC = b'TGGRAPH\0'
+VERSAO = 1
+FLAG_PESOS = 1
+CABECALHO = struct.Struct('<8sIIQQQQ')
+ALINHAMENTO = 8
+_LITTLE = sys.byteorder == 'little'
+
+
+def _padding(tamanho: int) -> bytes:
+    return b'\0' * (-tamanho % ALINHAMENTO)
+
+
+def _serializar_rotulos(labels: List[Any]) -> bytes:
+    """Codifica os rótulos como lista JSON; só aceita rótulos que voltam iguais (str, int, float, bool)."""
+    for v in labels:
+        if not isinstance(v, (str, int, float)):
+            raise ValueError(f"Rótulo não suportado no formato binário: {v!r}")
+    return json.dumps(labels, ensure_ascii=False).encode('utf-8')
+
+
+def write_graph_binary(g: Any, filename: str) -> None:
+    """
+    Grava g (main.Graph ou main.FrozenGraph) no formato binário.
+    Um Graph é antes empacotado em CSR com FrozenGraph.from_graph.
+    """
+    fg = g if isinstance(g, FrozenGraph) else FrozenGraph.from_graph(g)
+    rotulos = _serializar_rotulos(fg.nodes)
+    offsets = array('q', fg.offsets)
+    targets = array('i', fg.targets)
+    pesos = array('d', fg.edge_weights) if fg.edge_weights is not None else None
+    if not _LITTLE:
+        for a in (offsets, targets, pesos):
+            if a is not None:
+                a.byteswap()
+    flags = FLAG_PESOS if pesos is not None else 0
+    with open(filename, 'wb') as f:
+        f.write(CABECALHO.pack(MAGIC, VERSAO, flags, len(fg.nodes), len(targets), fg.num_edges, len(rotulos)))
+        f.write(rotulos)
+        f.write(_padding(len(rotulos)))
+        f.write(offsets.tobytes())
+        f.write(targets.tobytes())
+        f.write(_padding(targets.itemsize * len(targets)))
+        if pesos is not None:
+            f.write(pesos.tobytes())
+
+
+def _vetor(buf: memoryview, inicio: int, tipo: str, tamanho: int):
+    """
+    Fatia de buf a partir de inicio, vista como tamanho itens do tipo dado (sem cópia).
+    Em máquinas big-endian copia para um array e inverte os bytes.
+    """
+    item = array(tipo).itemsize
+    fatia = buf[inicio:inicio + item * tamanho]
+    if _LITTLE:
+        return fatia.cast(tipo)
+    a = array(tipo, fatia.tobytes())
+    a.byteswap()
+    return a
+
+
+def _validar_csr(offsets, targets, n: int, filename: str) -> None:
+    """
+    Confere que offsets começa em 0, é não decrescente e termina em len(targets), e que todo
+    target está em [0, n): um arquivo corrompido falha aqui, e não com um IndexError longe da
+    abertura. Com NumPy a verificação é vetorizada direto sobre o mmap (sem cópia).
+    """
+    if offsets[0] != 0 or offsets[n] != len(targets):
+        raise ValueError(f"Offsets inválidos no arquivo binário de grafo: {filename}")
+    if np is not None:
+        o = np.frombuffer(offsets, dtype=np.int64)
+        t = np.frombuffer(targets, dtype=np.int32)
+        monotono = bool(np.all(o[1:] >= o[:-1]))
+        fora = bool(t.size) and bool(t.min() < 0 or t.max() >= n)
+        del o, t  # não segura o buffer do mmap
+    else:
+        monotono = all(a <= b for a, b in zip(offsets, offsets[1:]))
+        fora = any(t < 0 or t >= n for t in targets)
+    if not monotono:
+        raise ValueError(f"Offsets inválidos no arquivo binário de grafo: {filename}")
+    if fora:
+        raise ValueError(f"Vizinho fora do intervalo de vértices no arquivo binário de grafo: {filename}")
+
+
+def load_graph_binary(filename: str) -> FrozenGraph:
+    """
+    Abre um arquivo gravado por write_graph_binary como FrozenGraph, mapeando o arquivo em memória:
+    offsets, targets e pesos são memoryviews sobre o mmap (somente leitura), então o custo de abrir
+    é o da tabela de rótulos mais uma verificação linear de offsets e targets (ver _validar_csr).
+    O mmap fica vivo enquanto o FrozenGraph existir.
+    """
+    try:
+        with open(filename, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Arquivo não encontrado: {filename}")
+    except ValueError:
+        raise ValueError(f"Arquivo binário de grafo inválido: {filename}")
+    if len(mm) < CABECALHO.size:
+        raise ValueError(f"Arquivo binário de grafo inválido: {filename}")
+    magic, versao, flags, n, num_targets, num_edges, tam_rotulos = CABECALHO.unpack_from(mm, 0)
+    if magic != MAGIC:
+        raise ValueError(f"Arquivo binário de grafo inválido: {filename}")
+    if versao != VERSAO:
+        raise ValueError(f"Versão {versao} do formato binário não suportada (esperada {VERSAO})")
+
+    pos = CABECALHO.size
+    # monta a tabela direto (os rótulos gravados já são distintos e estão na ordem dos ids)
+    if pos + tam_rotulos > len(mm):
+        raise ValueError(f"Arquivo binário de grafo truncado: {filename}")
+    labels = LabelTable()
+    try:
+        labels.labels = json.loads(mm[pos:pos + tam_rotulos].decode('utf-8'))
+    except ValueError:  # JSONDecodeError e UnicodeDecodeError
+        raise ValueError(f"Arquivo binário de grafo truncado: {filename}")
+    if not isinstance(labels.labels, list):
+        raise ValueError(f"Tabela de rótulos inconsistente em {filename}")
+    labels.ids = dict(zip(labels.labels, range(len(labels.labels))))
+    if len(labels.labels) != n or len(labels.ids) != n:
+        raise ValueError(f"Tabela de rótulos inconsistente em {filename}")
+    pos += tam_rotulos + (-tam_rotulos % ALINHAMENTO)
+    fim = pos + 8 * (n + 1) + 4 * num_targets
+    fim += -fim % ALINHAMENTO
+    if flags & FLAG_PESOS:
+        fim += 8 * num_targets
+    if len(mm) < fim:
+        raise ValueError(f"Arquivo binário de grafo truncado: {filename}")
+
+    buf = memoryview(mm)
+    offsets = _vetor(buf, pos, 'q', n + 1)
+    pos += 8 * (n + 1)
+    targets = _vetor(buf, pos, 'i', num_targets)
+    pos += 4 * num_targets
+    pos += -pos % ALINHAMENTO
+    pesos = _vetor(buf, pos, 'd', num_targets) if flags & FLAG_PESOS else None
+    _validar_csr(offsets, targets, n, filename)
+
+    fg = FrozenGraph(labels, offsets, targets, pesos, num_edges=num_edges)
+    fg._mmap = mm
+    return fg
+
+
+def converter_para_binario(origem: str, destino: str, formato: str = "grafo", weighted: bool = False) -> FrozenGraph:
+    """
+    Lê um arquivo em um dos formatos de texto e grava sua versão binária em destino.
+    formato:
+    - "grafo": vértices + número de arestas + arestas (graph_input.read_graph_from_file)
+    - "arestas": lista de arestas simples, CSV/TSV/espaços (graph_input.read_edge_list)
+    - "adjacencia" / "incidencia": matriz (matrix_input.read_matrix_from_file)
+    - "lista": lista de adjacência (matrix_input.read_adj_list_from_file)
+    Retorna o grafo reaberto do arquivo binário.
+    """
+    from graph_input import read_graph_from_file, read_edge_list
+    from matrix_input import read_matrix_from_file, read_adj_list_from_file
+
+    if formato == "grafo":
+        g = read_graph_from_file(origem, weighted)
+    elif formato == "arestas":
+        g = read_edge_list(origem, weighted or None)
+    elif formato == "adjacencia":
+        M, vertices = read_matrix_from_file(origem, "adjacency")
+        g = adj_matrix_to_graph(M, vertices)
+    elif formato == "incidencia":
+        I, vertices = read_matrix_from_file(origem, "incidence")
+        g = incidence_matrix_to_graph(I, vertices)
+    elif formato == "lista":
+        g = adj_list_to_graph(read_adj_list_from_file(origem))
+    else:
+        raise ValueError(f"Formato desconhecido: {formato}")
+    write_graph_binary(g, destino)
+    return load_graph_binary(destino)
+
+
+def converter_de_binario(origem: str, destino: str) -> Graph:
+    """
+    Lê um arquivo binário e grava o grafo no formato de texto de graph_input.read_graph_from_file
+    (vértices, número de arestas, arestas). Os pesos são gravados apenas se todas as arestas tiverem peso.
+    O formato de texto separa os campos por espaços e lê tudo como str, então só rótulos str não
+    vazios e sem espaços voltam iguais; qualquer outro rótulo (com espaço, int, float) gera ValueError
+    antes de o arquivo ser gravado.
+    """
+    g = load_graph_binary(origem).to_graph()
+    for v in g.nodes:
+        if not isinstance(v, str) or v.split() != [v]:
+            raise ValueError(f"Rótulo {v!r} não pode ser gravado no formato de texto (use rótulos str sem espaços)")
+    ponderado = len(g.weights) == len(g.edges) and len(g.edges) > 0
+    with open(destino, 'w') as f:
+        f.write(' '.join(map(str, g.nodes)) + '\n')
+        f.write(f"{len(g.edges)}\n")
+        for (u, v) in g.edges:
+            f.write(f"{u} {v} {g.weights[(u, v)]!r}\n" if ponderado else f"{u} {v}\n")
+    return g
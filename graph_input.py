@@ -1,6 +1,13 @@
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Iterable, Iterator, TextIO
+from itertools import islice, chain
+import bz2
+import gzip
+import lzma
 from main import Graph
 
+COMENTARIOS = ('#', '%')
+TAMANHO_LOTE = 65536
+
 def read_graph_from_terminal(weighted: bool = False) -> Graph:
     """
     Lê um grafo através do terminal.
@@ -78,6 +85,194 @@ def read_graph_from_terminal(weighted: bool = False) -> Graph:
     
     return Graph(vertices, edges, weights if weighted else None)
 
+def abrir_arquivo(filename: str) -> TextIO:
+    """
+    Abre filename para leitura de texto, descompactando de forma transparente arquivos
+    gzip, bz2 ou xz (o formato é detectado pelos bytes iniciais, não pela extensão).
+    """
+    with open(filename, 'rb') as f:
+        inicio = f.read(6)
+    if inicio.startswith(b'\x1f\x8b'):
+        return gzip.open(filename, 'rt')
+    if inicio.startswith(b'BZh'):
+        return bz2.open(filename, 'rt')
+    if inicio.startswith(b'\xfd7zXZ\x00'):
+        return lzma.open(filename, 'rt')
+    return open(filename, 'r')
+
+def _detectar_separador(linha: str) -> str:
+    """Separador de uma linha de lista de arestas: tab (TSV), vírgula (CSV) ou None (espaços)."""
+    if '\t' in linha:
+        return '\t'
+    if ',' in linha:
+        return ','
+    return None
+
+def iter_edge_list(linhas: Iterable[str], weighted: bool = None, delimiter: str = None) -> Iterator[Tuple]:
+    """
+    Gera as arestas de uma lista de arestas, uma por linha, sem guardar as linhas lidas.
+
+    Formato de cada linha: "vertice1 vertice2" ou "vertice1 vertice2 peso", com os campos
+    separados por espaços, tab ou vírgula (detectado na primeira linha de dados se delimiter
+    for None). Linhas vazias e linhas começando com # ou % são ignoradas.
+    - weighted None: usa a terceira coluna como peso quando ela existir
+    - weighted True: a terceira coluna é obrigatória
+    - weighted False: colunas além da segunda são ignoradas
+    Gera (u, v) ou (u, v, peso).
+    """
+    separador = delimiter
+    detectar = delimiter is None
+    for num, linha in enumerate(linhas, 1):
+        linha = linha.strip()
+        if not linha or linha[0] in COMENTARIOS:
+            continue
+        if detectar:
+            separador = _detectar_separador(linha)
+            detectar = False
+        campos = linha.split(separador)
+        if separador is not None:
+            campos = [c.strip() for c in campos]
+        if len(campos) < 2 or (weighted and len(campos) < 3):
+            raise ValueError(f"Formato inválido de aresta na linha {num}: {linha}")
+        if weighted is not False and len(campos) >= 3:
+            try:
+                yield campos[0], campos[1], float(campos[2])
+            except ValueError:
+                raise ValueError(f"Peso inválido na linha {num}: {campos[2]}")
+        else:
+            yield campos[0], campos[1]
+
+def read_edge_list(filename: str, weighted: bool = None, delimiter: str = None, graph: Graph = None, chunk_size: int = TAMANHO_LOTE) -> Graph:
+    """
+    Lê um grafo de um arquivo com uma aresta por linha (ver iter_edge_list), sem a lista de
+    vértices nem o número de arestas: os vértices são inferidos na ordem em que aparecem.
+
+    Exemplo de arquivo (CSV, com peso):
+    # origem,destino,peso
+    A,B,2.5
+    B,C,1.0
+
+    O arquivo (que pode estar compactado, ver abrir_arquivo) é lido em fluxo e as arestas são
+    inseridas em lotes de chunk_size no graph passado (ou em um grafo novo), então a memória
+    extra não depende do tamanho do arquivo.
+    """
+    g = graph if graph is not None else Graph([], [])
+    try:
+        with abrir_arquivo(filename) as f:
+            arestas = iter_edge_list(f, weighted, delimiter)
+            while True:
+                lote = list(islice(arestas, chunk_size))
+                if not lote:
+                    break
+                g.add_edges_from(lote)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Arquivo não encontrado: {filename}")
+    except ValueError as e:
+        raise ValueError(f"Erro ao ler o arquivo: {e}")
+    return g
+
+def iter_adj_list(linhas: Iterable[str]) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Gera (vértice, vizinhos) para cada linha "vertice: vizinho1 vizinho2 ..." de uma lista de
+    adjacência, sem guardar as linhas lidas; linhas vazias são ignoradas.
+    """
+    for line in linhas:
+        line = line.strip()
+        if not line:
+            continue
+        vertex, sep, resto = line.partition(':')
+        if not sep:
+            raise ValueError(f"Formato inválido na linha: {line}")
+        yield vertex.strip(), resto.split()
+
+def read_adj_list_stream(filename: str, graph: Graph = None, chunk_size: int = TAMANHO_LOTE) -> Graph:
+    """
+    Lê um arquivo de lista de adjacência em fluxo, direto para um Graph, sem montar o dicionário
+    intermediário de matrix_input.read_adj_list_from_file.
+
+    Formato (o mesmo de read_adj_list_from_file):
+    A B C D    # vértices (opcional: se a primeira linha tiver ':', os vértices são inferidos)
+    A: B C     # vizinhos de A
+    B: A       # vizinhos de B
+    D:         # vizinhos de D (nenhum)
+
+    - Os rótulos são internados no próprio grafo; com cabeçalho, vértices e vizinhos são validados
+      contra a tabela de ids (O(1) por entrada).
+    - As entradas simétricas (A: B e B: A) viram uma única aresta: a duplicata é detectada pelo
+      índice de vizinhança do Graph, comparando ids inteiros.
+    - As arestas são inseridas em lotes de chunk_size; arquivos gzip/bz2/xz são aceitos.
+    """
+    g = graph if graph is not None else Graph([], [])
+    try:
+        with abrir_arquivo(filename) as f:
+            primeira = f.readline()
+            validar = ':' not in primeira
+            if validar:
+                for v in primeira.split():
+                    g.add_node(v)
+                linhas = f
+            else:
+                linhas = chain([primeira], f)
+            ids = g.labels.ids
+            lote = []
+            for vertex, neighbors in iter_adj_list(linhas):
+                if validar:
+                    if vertex not in ids:
+                        raise ValueError(f"Vértice inválido: {vertex}")
+                    for w in neighbors:
+                        if w not in ids:
+                            raise ValueError(f"Vizinho inválido na linha: {vertex}: {' '.join(neighbors)}")
+                else:
+                    g.add_node(vertex)
+                for w in neighbors:
+                    lote.append((vertex, w))
+                if len(lote) >= chunk_size:
+                    g.add_edges_from(lote)
+                    lote = []
+            g.add_edges_from(lote)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Arquivo não encontrado: {filename}")
+    except ValueError as e:
+        raise ValueError(f"Erro ao ler o arquivo: {e}")
+    return g
+
+def _arestas_validadas(f, num_edges: int, vertices: set, weighted: bool) -> Iterator[Tuple]:
+    """Lê num_edges linhas de aresta de f validando os vértices contra o conjunto vertices."""
+    for _ in range(num_edges):
+        line = f.readline().strip().split()
+        if weighted:
+            if len(line) != 3:
+                raise ValueError(f"Formato inválido de aresta: {' '.join(line)}")
+            u, v, w = line
+            weight = float(w)
+        else:
+            if len(line) != 2:
+                raise ValueError(f"Formato inválido de aresta: {' '.join(line)}")
+            u, v = line
+        if u not in vertices or v not in vertices:
+            raise ValueError(f"Vértice não encontrado na lista de vértices: {u} ou {v}")
+        yield (u, v, weight) if weighted else (u, v)
+
+def _parece_aresta(linha: str) -> bool:
+    """
+    Diz se a primeira linha de um arquivo pode ser de uma lista de arestas (ver iter_edge_list)
+    em vez da lista de vértices: vazia ou comentário, com tab ou vírgula, com dois campos, ou com
+    três campos cujo último é um peso numérico.
+    """
+    linha = linha.strip()
+    if not linha or linha[0] in COMENTARIOS or _detectar_separador(linha) is not None:
+        return True
+    campos = linha.split()
+    if len(campos) == 2:
+        return True
+    if len(campos) == 3:
+        try:
+            float(campos[2])
+        except ValueError:
+            return False
+        return True
+    return False
+
 def read_graph_from_file(filename: str, weighted: bool = False) -> Graph:
     """
     Lê um grafo de um arquivo texto.
@@ -102,39 +297,27 @@ def read_graph_from_file(filename: str, weighted: bool = False) -> Graph:
     A B 2.5
     B C 1.0
     C D 3.7
+
+    Se a segunda linha não for um número e a primeira tiver cara de aresta (ver _parece_aresta),
+    o arquivo é lido como lista de arestas (ver read_edge_list), aceitando também CSV/TSV e
+    comentários; se a primeira linha for uma lista de vértices, é um erro de formato.
     """
     try:
         with open(filename, 'r') as f:
             # Lê os vértices
-            vertices = f.readline().strip().split()
-            
+            primeira = f.readline()
+            vertices = primeira.strip().split()
+
             # Lê o número de arestas
-            num_edges = int(f.readline().strip())
-            
-            # Lê as arestas
-            edges = []
-            weights = {}
-            for _ in range(num_edges):
-                line = f.readline().strip().split()
-                if weighted:
-                    if len(line) != 3:
-                        raise ValueError(f"Formato inválido de aresta: {' '.join(line)}")
-                    u, v, w = line
-                    weight = float(w)
-                    if u not in vertices or v not in vertices:
-                        raise ValueError(f"Vértice não encontrado na lista de vértices: {u} ou {v}")
-                    edges.append((u, v))
-                    weights[(u, v)] = weight
-                else:
-                    if len(line) != 2:
-                        raise ValueError(f"Formato inválido de aresta: {' '.join(line)}")
-                    u, v = line
-                    if u not in vertices or v not in vertices:
-                        raise ValueError(f"Vértice não encontrado na lista de vértices: {u} ou {v}")
-                    edges.append((u, v))
-                    
-        return Graph(vertices, edges, weights if weighted else None)
+            segunda = f.readline().strip()
+            if segunda.isdigit():
+                # Lê as arestas em fluxo, validando contra um conjunto (O(1) por aresta)
+                num_edges = int(segunda)
+                return Graph.from_edges(_arestas_validadas(f, num_edges, set(vertices), weighted), nodes=vertices)
+            if not _parece_aresta(primeira):
+                raise ValueError(f"Número de arestas inválido na linha 2: {segunda}")
     except FileNotFoundError:
         raise FileNotFoundError(f"Arquivo não encontrado: {filename}")
     except ValueError as e:
-        raise ValueError(f"Erro ao ler o arquivo: {e}")
\ No newline at end of file
+        raise ValueError(f"Erro ao ler o arquivo: {e}")
+    return read_edge_list(filename, weighted or None)
@@ -2,21 +2,31 @@
 isomorphism.py
 Módulo para verificação de isomorfismo de grafos.
 
-Implementa uma estratégia hierárquica em 3 etapas:
+Implementa uma estratégia hierárquica em 4 etapas:
 1. Condições necessárias (O(n + m))
 2. Invariantes estruturais (O(n²))
-3. Busca estrutural (O(n!), apenas para grafos pequenos)
+3. Refinamento de cores 1-WL (O(m log n))
+4. Busca estrutural (estilo VF2, backtracking com poda, sem limite de tamanho)
+
+Para coleções de grafos, certificado() dá um hash da forma canônica (individualização e
+refinamento, estilo nauty): dois grafos são isomorfos se e somente se os certificados coincidem.
+classificar_isomorfismo() particiona uma lista de grafos em classes, agrupando por invariantes e
+rodando a busca só dentro de cada grupo, em paralelo.
 
 Série 4 - Teoria dos Grafos - UNIFESP
 """
 
-from main import Graph, list_all_degrees, get_nodes_num, get_edge_num
+from main import Graph, list_all_degrees, degree_sequence, get_nodes_num, get_edge_num, cached_spring_layout
+from bitset_graph import BitsetGraph
 from typing import Dict, Tuple, List, Optional
-from collections import Counter
+from collections import Counter, deque
 from itertools import permutations
+from multiprocessing import Pool
+import hashlib
 import matplotlib.pyplot as plt
 import networkx as nx
 import os
+import time
 
 
 # ==================== CONDIÇÕES NECESSÁRIAS ====================
@@ -48,8 +58,8 @@ def verificar_condicoes_necessarias(g1: Graph, g2: Graph) -> Tuple[bool, str]:
         return False, f"Número de arestas diferente: |E1|={m1}, |E2|={m2}"
     
     # 3. Mesma sequência de graus
-    graus1 = sorted(list_all_degrees(g=g1).values())
-    graus2 = sorted(list_all_degrees(g=g2).values())
+    graus1 = degree_sequence(g=g1)
+    graus2 = degree_sequence(g=g2)
     if graus1 != graus2:
         return False, f"Sequência de graus diferente: {graus1} ≠ {graus2}"
     
@@ -58,31 +68,21 @@ def verificar_condicoes_necessarias(g1: Graph, g2: Graph) -> Tuple[bool, str]:
 
 # ==================== INVARIANTES ESTRUTURAIS ====================
 
-def contar_triangulos(g: Graph) -> int:
+def contar_triangulos(g) -> int:
     """
     Conta o número de triângulos (ciclos de tamanho 3) no grafo.
     
     Args:
-        g: Grafo a analisar
+        g: Grafo a analisar (Graph ou BitsetGraph)
     
     Returns:
         Número de triângulos encontrados
     
-    Complexity: O(n³) - testa todas as triplas de vértices
+    Complexity: O(m * n / w) - para cada aresta, AND das máscaras de vizinhança (w = bits por palavra)
     """
-    triangulos = 0
-    vertices = g.nodes
-    
-    for i, v1 in enumerate(vertices):
-        for j, v2 in enumerate(vertices[i+1:], i+1):
-            for k, v3 in enumerate(vertices[j+1:], j+1):
-                # Verificar se formam um triângulo
-                if ((v1, v2) in g.edges or (v2, v1) in g.edges) and \
-                   ((v1, v3) in g.edges or (v3, v1) in g.edges) and \
-                   ((v2, v3) in g.edges or (v3, v2) in g.edges):
-                    triangulos += 1
-    
-    return triangulos
+    if not isinstance(g, BitsetGraph):
+        g = BitsetGraph.from_graph(g)
+    return g.count_triangles()
 
 
 def calcular_invariantes(g: Graph) -> Dict:
@@ -96,18 +96,26 @@ def calcular_invariantes(g: Graph) -> Dict:
     Returns:
         Dicionário com invariantes estruturais
     
-    Complexity: O(n²) para grafos pequenos (devido à contagem de triângulos)
+    Complexity: O(n²) para grafos pequenos (devido à contagem de triângulos);
+    O(1) em chamadas repetidas enquanto o grafo não for alterado (cache do Graph)
     """
-    graus = list_all_degrees(g=g)
+    if isinstance(g, Graph):
+        return dict(g.cached('invariantes', lambda: _calcular_invariantes(g)))
+    return _calcular_invariantes(g)
+
+
+def _calcular_invariantes(g: Graph) -> Dict:
+    """Cálculo efetivo dos invariantes de calcular_invariantes (sem cache)."""
+    graus = list_all_degrees(g=g, as_array=True)
     
     invariantes = {
         'num_vertices': get_nodes_num(g=g),
         'num_arestas': get_edge_num(g=g),
-        'sequencia_graus': tuple(sorted(graus.values())),
-        'grau_max': max(graus.values()) if graus else 0,
-        'grau_min': min(graus.values()) if graus else 0,
-        'distribuicao_graus': dict(Counter(graus.values())),
-        'soma_graus': sum(graus.values()),
+        'sequencia_graus': tuple(sorted(graus)),
+        'grau_max': max(graus) if graus else 0,
+        'grau_min': min(graus) if graus else 0,
+        'distribuicao_graus': dict(Counter(graus)),
+        'soma_graus': sum(graus),
     }
     
     # Calcular número de triângulos (apenas para grafos pequenos)
@@ -140,6 +148,384 @@ def verificar_invariantes(g1: Graph, g2: Graph) -> Tuple[bool, str]:
     return True, "Invariantes estruturais idênticos"
 
 
+# ==================== REFINAMENTO DE CORES (1-WL) ====================
+
+def _adjacencias(g) -> Tuple[List, List[set]]:
+    """
+    Retorna (rótulos, vizinhos) com vértices como ids densos: vizinhos[i] é o conjunto dos ids
+    adjacentes a i (um loop aparece como i em vizinhos[i]). Para main.Graph reaproveita o índice _adj.
+    """
+    if isinstance(g, Graph):
+        return g.nodes, [set(viz) for viz in g._adj]
+    ids = {v: i for i, v in enumerate(g.nodes)}
+    return list(g.nodes), [set(ids[w] for w in g.neighbors(v)) for v in g.nodes]
+
+
+def _refinar_cores(vizinhos: List[set], cores: List = None, lados: bytearray = None,
+                   alterados: List[int] = None) -> Optional[Tuple[List[int], int]]:
+    """
+    Refinamento de cores de Weisfeiler-Lehman (1-WL) até a partição estável.
+
+    A cada rodada a nova cor de um vértice é determinada por (cor atual, cores dos vizinhos ordenadas).
+    Só são re-hasheados os vizinhos de vértices que mudaram de cor na rodada anterior: numa classe
+    que se divide, a maior parte mantém a cor e as demais recebem cores novas, que disparam a rodada
+    seguinte (como no algoritmo de Hopcroft; os vértices não tocados da classe formam uma parte).
+    As cores novas são numeradas em ordem de (cor antiga, assinatura), então dependem apenas da
+    estrutura: grafos isomorfos recebem as mesmas cores, independente da ordem dos vértices.
+
+    cores: cores iniciais (valores comparáveis); padrão = (grau, tem loop).
+    lados: para refinar a união disjunta de dois grafos, lados[v] indica o grafo de v (0 ou 1);
+        nesse caso retorna None assim que alguma cor aparecer um número diferente de vezes em cada lado.
+    alterados: retoma o refinamento de uma partição já estável em que só esses vértices mudaram de
+        cor (individualização); cores deve então ser a lista de cores 0..k-1 de _refinar_cores.
+
+    Returns:
+        (cor de cada vértice, número de rodadas), ou None (histogramas diferentes, ver lados)
+
+    Complexity: O(m log n) assinaturas de vizinhança no total, em vez de O(n * m) com re-hash completo
+    """
+    n = len(vizinhos)
+    if alterados is None:
+        if cores is None:
+            cores = [(len(viz), i in viz) for i, viz in enumerate(vizinhos)]
+        numeracao = {c: k for k, c in enumerate(sorted(set(cores)))}
+        cor = [numeracao[c] for c in cores]
+        alterados = range(n)
+    else:
+        cor = list(cores)
+    membros = [set() for _ in range(max(cor, default=-1) + 1)]
+    for v in range(n):
+        membros[cor[v]].add(v)
+    if lados is not None and any(2 * sum(lados[v] for v in m) != len(m) for m in membros):
+        return None
+
+    rodadas = 0
+    while alterados:
+        tocados = set()
+        for v in alterados:
+            tocados.update(vizinhos[v])
+        grupos = {}
+        for v in tocados:
+            assinatura = tuple(sorted([cor[w] for w in vizinhos[v]]))
+            grupos.setdefault(cor[v], {}).setdefault(assinatura, []).append(v)
+
+        alterados = []
+        for c in sorted(grupos):
+            por_assinatura = grupos[c]
+            partes = [por_assinatura[a] for a in sorted(por_assinatura)]
+            intactos = len(membros[c]) - sum(len(parte) for parte in partes)
+            if intactos == 0 and len(partes) == 1:
+                continue
+            # a maior parte mantém a cor (empate: intactos, depois menor assinatura)
+            maior = max(range(len(partes)), key=lambda k: (len(partes[k]), -k))
+            if intactos < len(partes[maior]):
+                mantida = partes.pop(maior)
+                if intactos:
+                    tocados_c = set().union(*partes, mantida)
+                    partes.insert(0, [v for v in membros[c] if v not in tocados_c])
+            for parte in partes:
+                if lados is not None and 2 * sum(lados[v] for v in parte) != len(parte):
+                    return None
+                nova = len(membros)
+                membros[c].difference_update(parte)
+                membros.append(set(parte))
+                for v in parte:
+                    cor[v] = nova
+                alterados.extend(parte)
+        if alterados:
+            rodadas += 1
+    return cor, rodadas
+
+
+def refinamento_cores(g1, g2) -> Tuple[bool, str, List[int], List[int]]:
+    """
+    Etapa de refinamento de cores (1-WL) aplicada aos dois grafos ao mesmo tempo.
+
+    O refinamento roda na união disjunta de G1 e G2, de modo que as cores são comparáveis entre os
+    grafos; se em alguma rodada uma cor aparece um número diferente de vezes em cada grafo, os
+    grafos não são isomorfos (detecta, por exemplo, grafos regulares com a mesma sequência de graus
+    mas estrutura diferente, que passam pelos invariantes).
+
+    Returns:
+        Tupla (é_possível, mensagem, cores1, cores2), com cores paralelas a g1.nodes e g2.nodes
+        (a partição estável, usada pela busca estrutural para restringir os candidatos)
+    """
+    _, viz1 = _adjacencias(g1)
+    _, viz2 = _adjacencias(g2)
+    n1 = len(viz1)
+    if n1 != len(viz2):
+        return False, f"Número de vértices diferente: {n1} ≠ {len(viz2)}", [], []
+    uniao = viz1 + [set(w + n1 for w in viz) for viz in viz2]
+    resultado = _refinar_cores(uniao, lados=bytearray(n1) + bytearray(b'\1' * n1))
+    if resultado is None:
+        return False, "Histogramas de cores diferentes no refinamento 1-WL", [], []
+    cor, rodadas = resultado
+    classes = len(set(cor))
+    return True, f"Partição estável com {classes} cores após {rodadas} rodadas", cor[:n1], cor[n1:]
+
+
+# ==================== ROTULAÇÃO CANÔNICA ====================
+
+def _celula_alvo(cor: List[int]) -> Optional[List[int]]:
+    """Menor célula não unitária da partição (empate: menor cor), ou None se a partição é discreta."""
+    tamanhos = Counter(cor)
+    candidatas = [(t, c) for c, t in tamanhos.items() if t > 1]
+    if not candidatas:
+        return None
+    _, alvo = min(candidatas)
+    return [v for v, c in enumerate(cor) if c == alvo]
+
+
+def _arestas_rotuladas(vizinhos: List[set], cor: List[int]) -> List[Tuple[int, int]]:
+    """Arestas (com loops) renomeadas pela partição discreta cor, ordenadas: o grafo rotulado da folha."""
+    return sorted((cor[u], cor[w]) if cor[u] <= cor[w] else (cor[w], cor[u])
+                  for u, viz in enumerate(vizinhos) for w in viz if u <= w)
+
+
+def _raiz(uf: Dict[int, int], v: int) -> int:
+    while uf.get(v, v) != v:
+        uf[v] = uf.get(uf[v], uf[v])
+        v = uf[v]
+    return v
+
+
+def _podar_arvores(vizinhos: List[set]) -> Tuple[List[int], List[List[int]], List[Tuple]]:
+    """
+    Remove as árvores penduradas no grafo, folha por folha, em camadas (todas as folhas atuais de uma
+    vez), e codifica cada subárvore removida por um inteiro (AHU): o código de v depende só dos códigos
+    dos filhos ordenados, e as assinaturas novas de cada camada são numeradas em ordem, então o código
+    é canônico. O que sobra é o 2-núcleo (mais vértices com loop), onde fica a parte difícil.
+
+    Returns:
+        (codigo, filhos, componentes): codigo[v] é o código da subárvore de v, ou -1 se v ficou no
+        núcleo; filhos[v] são os vértices removidos pendurados em v; componentes lista as componentes
+        que são árvores inteiras como (chave, centros), com 1 ou 2 centros
+    """
+    n = len(vizinhos)
+    laco = [v in viz for v, viz in enumerate(vizinhos)]
+    restante = [len(viz) - laco[v] for v, viz in enumerate(vizinhos)]
+    removido = bytearray(n)
+    codigo = [-1] * n
+    filhos = [[] for _ in range(n)]
+    tabela = {}
+    componentes = []
+    camada = [v for v in range(n) if restante[v] <= 1 and not laco[v]]
+    while camada:
+        assinaturas = [tuple(sorted([codigo[w] for w in filhos[v]])) for v in camada]
+        for a in sorted(set(assinaturas) - tabela.keys()):
+            tabela[a] = len(tabela)
+        na_camada = set(camada)
+        for v, a in zip(camada, assinaturas):
+            codigo[v] = tabela[a]
+        candidatos = set()
+        for v in camada:
+            pai = next((w for w in vizinhos[v] if w != v and not removido[w]), None)
+            if pai is None:
+                componentes.append(((0, codigo[v]), [v]))
+            elif pai in na_camada:
+                # árvore bicentral: as duas folhas restantes são vizinhas
+                if v < pai:
+                    centros = sorted((v, pai), key=codigo.__getitem__)
+                    componentes.append(((1, codigo[centros[0]], codigo[centros[1]]), centros))
+            else:
+                filhos[pai].append(v)
+                restante[pai] -= 1
+                candidatos.add(pai)
+        for v in camada:
+            removido[v] = 1
+        camada = [u for u in candidatos if restante[u] <= 1 and not laco[u]]
+    return codigo, filhos, componentes
+
+
+def _busca_canonica(vizinhos: List[set], cores: List, contagem: Dict[str, int]) -> List[int]:
+    """
+    Busca por individualização e refinamento; retorna a partição discreta canônica (posição de cada
+    vértice) do grafo com as cores iniciais dadas. Ver rotulacao_canonica.
+    """
+    n = len(vizinhos)
+    geradores = []  # automorfismos esparsos: {v: imagem} só nos pontos que se movem
+    primeira = melhor = None  # (arestas, cor, caminho)
+
+    # gêmeos (mesma cor inicial e mesma vizinhança aberta ou fechada) são trocados por um automorfismo
+    # que fixa o resto: são individualizados juntos e só um deles é ramificado
+    por_vizinhanca = {}
+    for v, viz in enumerate(vizinhos):
+        por_vizinhanca.setdefault((cores[v], frozenset(viz - {v}), False), []).append(v)
+        por_vizinhanca.setdefault((cores[v], frozenset(viz | {v}), True), []).append(v)
+    gemeos = [[v] for v in range(n)]
+    for grupo in por_vizinhanca.values():
+        if len(grupo) > 1:
+            for v in grupo:
+                gemeos[v] = grupo
+
+    def filho(cor, v):
+        """Individualiza v e seus gêmeos da mesma célula (cores novas; as cores são 0..k-1) e refina."""
+        grupo = [w for w in gemeos[v] if cor[w] == cor[v]]
+        if len(grupo) == cor.count(cor[v]):
+            grupo = grupo[1:]  # a célula inteira é de gêmeos: o primeiro fica com a cor da célula
+        nova = list(cor)
+        proxima = max(cor) + 1
+        for k, w in enumerate(grupo):
+            nova[w] = proxima + k
+        return _refinar_cores(vizinhos, nova, alterados=grupo)[0]
+
+    pilha = []    # nós abertos: [cor, célula alvo, próximo índice, explorados, union-find, geradores vistos]
+    caminho = []  # vértice individualizado em cada nível acima do topo
+
+    def visitar(cor):
+        """Abre o nó (empilha) ou trata a folha; retorna o nível para onde a busca deve voltar."""
+        nonlocal primeira, melhor
+        contagem['nos'] += 1
+        celula = _celula_alvo(cor)
+        if celula is not None:
+            celula = [v for v in celula if min(w for w in gemeos[v] if cor[w] == cor[v]) == v]
+            pilha.append([cor, celula, 0, [], {}, 0])
+            return None
+        contagem['folhas'] += 1
+        arestas = _arestas_rotuladas(vizinhos, cor)
+        if primeira is None:
+            primeira = melhor = (arestas, cor, list(caminho))
+            return None
+        for base in (primeira, melhor):
+            if arestas == base[0]:
+                # automorfismo: vértice de mesma posição na folha base -> vértice da folha atual
+                posicao = [0] * n
+                for v, c in enumerate(cor):
+                    posicao[c] = v
+                gamma = {v: posicao[c] for v, c in enumerate(base[1]) if posicao[c] != v}
+                geradores.append(gamma)
+                contagem['automorfismos'] += 1
+                if base is primeira:
+                    return next(i for i, (a, b) in enumerate(zip(caminho, base[2])) if a != b)
+                return None
+        if arestas < melhor[0]:
+            melhor = (arestas, cor, list(caminho))
+        return None
+
+    visitar(_refinar_cores(vizinhos, cores)[0])
+    while pilha:
+        no = pilha[-1]
+        cor, celula, i, explorados, uf, vistos = no
+        # órbitas do subgrupo gerado pelos automorfismos que fixam o caminho até este nó
+        prefixo = caminho[:len(pilha) - 1]
+        for gamma in geradores[vistos:]:
+            if all(gamma.get(p, p) == p for p in prefixo):
+                for v, w in gamma.items():
+                    a, b = _raiz(uf, v), _raiz(uf, w)
+                    if a != b:
+                        uf[max(a, b)] = min(a, b)
+        no[5] = len(geradores)
+        orbitas = {_raiz(uf, x) for x in explorados}
+        while i < len(celula) and _raiz(uf, celula[i]) in orbitas:
+            i += 1
+        if i == len(celula):
+            pilha.pop()
+            if pilha:
+                caminho.pop()
+            continue
+        v = celula[i]
+        no[2] = i + 1
+        explorados.append(v)
+        caminho.append(v)
+        profundidade = len(pilha)
+        volta = visitar(filho(cor, v))
+        if len(pilha) == profundidade:
+            caminho.pop()  # era folha
+            if volta is not None:
+                del pilha[volta + 1:]
+                del caminho[volta:]
+    return melhor[1]
+
+
+def rotulacao_canonica(g, stats: Dict = None) -> Tuple[Dict, List[Tuple[int, int]]]:
+    """
+    Rotulação canônica de g (estilo nauty): grafos isomorfos recebem exatamente o mesmo grafo rotulado.
+
+    1. As árvores penduradas são podadas e codificadas (_podar_arvores); o código das subárvores de
+       cada vértice do núcleo entra na sua cor inicial.
+    2. O núcleo passa pela árvore de busca de partições (_busca_canonica):
+       - cada nó é uma partição equitável (estável pelo refinamento 1-WL de _refinar_cores);
+       - um nó não discreto escolhe a menor célula não unitária e, para cada vértice dela, individualiza
+         o vértice (cor própria) e refina de novo a partir dele;
+       - cada folha (partição discreta) define uma numeração dos vértices; a forma canônica é o menor
+         grafo rotulado (lista ordenada de arestas) entre as folhas.
+       Poda por automorfismos: duas folhas com o mesmo grafo rotulado definem um automorfismo. Se a
+       folha equivale à primeira, a busca volta direto ao nó onde os dois caminhos se separam (a
+       subárvore atual é imagem da primeira). Em cada nó, filhos na mesma órbita de um filho já
+       explorado (pelos automorfismos conhecidos que fixam os vértices individualizados acima) são
+       pulados. A busca usa pilha explícita (a profundidade pode chegar a n).
+    3. Os vértices das árvores recebem as posições seguintes, em pré-ordem a partir do núcleo (e das
+       componentes-árvore, ordenadas pelo código), com os filhos em ordem de código; filhos de mesmo
+       código têm subárvores iguais, então a ordem entre eles não muda o grafo rotulado.
+
+    Pesos e rótulos não entram na forma canônica (isomorfismo estrutural, como no restante do módulo).
+
+    Args:
+        g: main.Graph (ou grafo com nodes/neighbors)
+        stats: se for um dict, recebe 'nucleo' (vértices após a poda), 'nos', 'folhas',
+               'automorfismos' e 'tempo' (s)
+
+    Returns:
+        Tupla (rotulacao, arestas): rótulo -> posição canônica (0..n-1) e a lista ordenada de arestas
+        canônicas (i, j), i <= j
+
+    Complexity: polinomial na prática (poda + refinamento + automorfismos); exponencial no pior caso
+    """
+    inicio = time.perf_counter()
+    nodes, vizinhos = _adjacencias(g)
+    n = len(nodes)
+    contagem = {'nos': 0, 'folhas': 0, 'automorfismos': 0}
+
+    codigo, filhos, componentes = _podar_arvores(vizinhos)
+    nucleo = [v for v in range(n) if codigo[v] < 0]
+    sequencia = [None] * len(nucleo)
+    if nucleo:
+        indice = {v: i for i, v in enumerate(nucleo)}
+        viz_nucleo = [{indice[w] for w in vizinhos[v] if w in indice} for v in nucleo]
+        cores = [(len(viz), i in viz, tuple(sorted([codigo[w] for w in filhos[v]])))
+                 for i, (v, viz) in enumerate(zip(nucleo, viz_nucleo))]
+        for i, c in enumerate(_busca_canonica(viz_nucleo, cores, contagem)):
+            sequencia[c] = nucleo[i]
+
+    def pendurar(raiz):
+        pilha = [raiz]
+        while pilha:
+            u = pilha.pop()
+            if u != raiz:
+                sequencia.append(u)
+            pilha.extend(sorted(filhos[u], key=codigo.__getitem__, reverse=True))
+
+    for v in sequencia[:]:
+        pendurar(v)
+    for _, centros in sorted(componentes, key=lambda c: c[0]):
+        for v in centros:
+            sequencia.append(v)
+            pendurar(v)
+
+    posicao = [0] * n
+    for i, v in enumerate(sequencia):
+        posicao[v] = i
+    if stats is not None:
+        stats.update(contagem, nucleo = len(nucleo), tempo = time.perf_counter() - inicio)
+    return {nodes[v]: posicao[v] for v in range(n)}, _arestas_rotuladas(vizinhos, posicao)
+
+
+def certificado(g) -> str:
+    """
+    Certificado de isomorfismo: hash SHA-256 (hex) da forma canônica de g.
+    Dois grafos são isomorfos se e somente se têm o mesmo certificado (a menos de colisão do hash),
+    então agrupar uma coleção por certificado custa uma rotulação canônica por grafo, sem comparações
+    par a par.
+    """
+    rotulacao, arestas = rotulacao_canonica(g)
+    return _hash_forma_canonica(len(rotulacao), arestas)
+
+
+def _hash_forma_canonica(n: int, arestas: List[Tuple[int, int]]) -> str:
+    texto = f"{n}:" + ";".join(f"{i},{j}" for i, j in arestas)
+    return hashlib.sha256(texto.encode()).hexdigest()
+
+
 # ==================== BUSCA ESTRUTURAL ====================
 
 def construir_mapeamento_por_grau(g1: Graph, g2: Graph) -> Dict[int, Tuple[List, List]]:
@@ -173,41 +559,28 @@ def construir_mapeamento_por_grau(g1: Graph, g2: Graph) -> Dict[int, Tuple[List,
     return grupos
 
 
-def verificar_mapeamento(g1: Graph, g2: Graph, mapeamento: Dict) -> bool:
+def verificar_mapeamento(g1, g2, mapeamento: Dict) -> bool:
     """
     Verifica se um mapeamento específico preserva a estrutura (é isomorfismo).
     
-    Para cada aresta (u, v) em G1, deve existir aresta (f(u), f(v)) em G2.
+    O mapeamento deve ser bijetor e, para cada vértice u de G1, a vizinhança de u
+    mapeada por f deve ser exatamente a vizinhança de f(u) em G2 (comparação de máscaras de bits).
     
     Args:
-        g1: Primeiro grafo
-        g2: Segundo grafo
+        g1: Primeiro grafo (Graph ou BitsetGraph)
+        g2: Segundo grafo (Graph ou BitsetGraph)
         mapeamento: Dicionário {vértice_g1: vértice_g2}
     
     Returns:
         True se o mapeamento preserva adjacências, False caso contrário
     
-    Complexity: O(m) onde m é o número de arestas
+    Complexity: O(n + m) onde m é o número de arestas
     """
-    # Verificar todas as arestas de G1
-    for u, v in g1.edges:
-        u_map = mapeamento[u]
-        v_map = mapeamento[v]
-        
-        # Verificar se aresta mapeada existe em G2
-        if (u_map, v_map) not in g2.edges and (v_map, u_map) not in g2.edges:
-            return False
-    
-    # Verificar todas as arestas de G2 (garantir bijeção)
-    for u, v in g2.edges:
-        # Encontrar vértices originais em G1
-        u_orig = [k for k, val in mapeamento.items() if val == u][0]
-        v_orig = [k for k, val in mapeamento.items() if val == v][0]
-        
-        if (u_orig, v_orig) not in g1.edges and (v_orig, u_orig) not in g1.edges:
-            return False
-    
-    return True
+    if not isinstance(g1, BitsetGraph):
+        g1 = BitsetGraph.from_graph(g1)
+    if not isinstance(g2, BitsetGraph):
+        g2 = BitsetGraph.from_graph(g2)
+    return g1.is_isomorphism(g2, mapeamento)
 
 
 def buscar_isomorfismo_forca_bruta(g1: Graph, g2: Graph, limite_vertices: int = 8) -> Tuple[bool, Dict]:
@@ -244,11 +617,6 @@ def buscar_isomorfismo_forca_bruta(g1: Graph, g2: Graph, limite_vertices: int =
         # Fixar ordem dos vértices de G1
         v1_ordem = g1.nodes
         
-        # Para cada grupo de grau, gerar permutações dos vértices de G2
-        grupos_permutacoes = {}
-        for grau, (v1_list, v2_list) in grupos.items():
-            grupos_permutacoes[grau] = list(permutations(v2_list))
-        
         # Combinar permutações de todos os grupos
         def combinar_grupos(grau_idx: int, mapa_parcial: Dict):
             if grau_idx >= len(grupos):
@@ -258,7 +626,7 @@ def buscar_isomorfismo_forca_bruta(g1: Graph, g2: Graph, limite_vertices: int =
             grau = list(grupos.keys())[grau_idx]
             v1_list, v2_list = grupos[grau]
             
-            for perm in grupos_permutacoes[grau]:
+            for perm in permutations(v2_list):
                 novo_mapa = mapa_parcial.copy()
                 for v1, v2 in zip(v1_list, perm):
                     novo_mapa[v1] = v2
@@ -267,14 +635,144 @@ def buscar_isomorfismo_forca_bruta(g1: Graph, g2: Graph, limite_vertices: int =
         
         yield from combinar_grupos(0, {})
     
-    # Testar cada mapeamento
+    # Testar cada mapeamento (máscaras de bits construídas uma única vez)
+    b1, b2 = BitsetGraph.from_graph(g1), BitsetGraph.from_graph(g2)
     for mapeamento in gerar_mapeamentos():
-        if verificar_mapeamento(g1, g2, mapeamento):
+        if verificar_mapeamento(b1, b2, mapeamento):
             return True, mapeamento
     
     return False, {}
 
 
+def _assinaturas(vizinhos: List[set], cores: List = None) -> List[Tuple]:
+    """
+    Assinatura de cada vértice, preservada por isomorfismo: (cor, grau, tem loop, graus dos vizinhos
+    ordenados). Dois vértices só podem ser mapeados um no outro se tiverem a mesma assinatura.
+    """
+    graus = [len(viz) for viz in vizinhos]
+    return [(cores[i] if cores is not None else None, graus[i], i in viz, tuple(sorted(graus[w] for w in viz)))
+            for i, viz in enumerate(vizinhos)]
+
+
+def _ordem_busca(vizinhos: List[set], assinatura: List[int], frequencia: Counter) -> Tuple[List[int], List[int]]:
+    """
+    Ordem em que os vértices de G1 são mapeados: BFS por componente, começando pelo vértice de
+    assinatura mais rara (e maior grau) e visitando primeiro os vizinhos de maior grau. Assim todo
+    vértice, exceto as raízes, tem um vizinho já mapeado (o pai), que restringe seus candidatos.
+    Retorna (ordem, pai), com pai[k] = vértice pai de ordem[k] ou -1 para raízes.
+    """
+    n = len(vizinhos)
+    raizes = sorted(range(n), key=lambda i: (frequencia[assinatura[i]], -len(vizinhos[i])))
+    visto = bytearray(n)
+    ordem, pai = [], []
+    for r in raizes:
+        if visto[r]:
+            continue
+        visto[r] = 1
+        ordem.append(r)
+        pai.append(-1)
+        fila = deque([r])
+        while fila:
+            u = fila.popleft()
+            for w in sorted(vizinhos[u], key=lambda x: (frequencia[assinatura[x]], -len(vizinhos[x]))):
+                if not visto[w]:
+                    visto[w] = 1
+                    ordem.append(w)
+                    pai.append(u)
+                    fila.append(w)
+    return ordem, pai
+
+
+def buscar_isomorfismo_vf2(g1, g2, cores1: List = None, cores2: List = None) -> Tuple[bool, Dict]:
+    """
+    Busca por isomorfismo no espaço de estados (estilo VF2), sem limite de tamanho.
+
+    O mapeamento parcial é estendido um vértice de G1 por vez (na ordem de _ordem_busca) com
+    backtracking iterativo (pilha explícita, sem recursão). Para cada par candidato (u, v):
+    - regra de grau/vizinhança: u e v precisam ter a mesma assinatura (cor, grau, loop e multiconjunto
+      dos graus dos vizinhos), o que também limita os candidatos de cada vértice;
+    - consistência: todo vizinho de u já mapeado deve ir para um vizinho de v, e v não pode ter mais
+      vizinhos já usados do que u tem vizinhos já mapeados (nenhuma aresta sobrando).
+    Os candidatos de um vértice com pai na BFS são só os vizinhos livres da imagem do pai.
+    cores1/cores2 (opcionais, listas paralelas a nodes) restringem o mapeamento a vértices da mesma cor.
+
+    Returns:
+        Tupla (é_isomorfo, mapeamento) onde mapeamento é vazio se não for isomorfo
+
+    Complexity: exponencial no pior caso (grafos muito simétricos), mas quase linear para grafos
+    esparsos típicos, em que as assinaturas e a ordem BFS deixam poucos candidatos por vértice
+    """
+    nodes1, viz1 = _adjacencias(g1)
+    nodes2, viz2 = _adjacencias(g2)
+    imagem = _mapear_vf2(viz1, viz2, cores1, cores2)
+    if imagem is None:
+        return False, {}
+    return True, {nodes1[u]: nodes2[v] for u, v in enumerate(imagem)}
+
+
+def _mapear_vf2(viz1: List[set], viz2: List[set], cores1: List = None, cores2: List = None) -> Optional[List[int]]:
+    """Núcleo de buscar_isomorfismo_vf2 sobre ids: retorna imagem[u] (vértice de G2) ou None."""
+    n = len(viz1)
+    if n != len(viz2):
+        return None
+    if n == 0:
+        return []
+
+    # assinaturas viram ints (comparação O(1)); multiconjuntos diferentes -> não isomorfos
+    tabela = {}
+    sig1 = [tabela.setdefault(a, len(tabela)) for a in _assinaturas(viz1, cores1)]
+    sig2 = [tabela.setdefault(a, len(tabela)) for a in _assinaturas(viz2, cores2)]
+    frequencia = Counter(sig1)
+    if frequencia != Counter(sig2):
+        return None
+    por_assinatura = {}
+    for v, a in enumerate(sig2):
+        por_assinatura.setdefault(a, []).append(v)
+
+    ordem, pai = _ordem_busca(viz1, sig1, frequencia)
+    posicao = [0] * n
+    for k, u in enumerate(ordem):
+        posicao[u] = k
+    # vizinhos de cada vértice de G1 mapeados antes dele (fixos, pois a ordem é fixa)
+    anteriores = [[w for w in viz1[u] if posicao[w] < k] for k, u in enumerate(ordem)]
+
+    imagem = [-1] * n     # vértice de G1 -> vértice de G2
+    usado = bytearray(n)  # vértices de G2 já usados
+
+    def candidatos(k):
+        u = ordem[k]
+        base = viz2[imagem[pai[k]]] if pai[k] >= 0 else por_assinatura[sig1[u]]
+        a = sig1[u]
+        return (v for v in base if not usado[v] and sig2[v] == a)
+
+    def viavel(k, v):
+        ant = anteriores[k]
+        vizinhos_v = viz2[v]
+        for w in ant:
+            if imagem[w] not in vizinhos_v:
+                return False
+        return sum(1 for x in vizinhos_v if usado[x]) == len(ant)
+
+    pilha = [candidatos(0)]
+    while pilha:
+        k = len(pilha) - 1
+        for v in pilha[-1]:
+            if viavel(k, v):
+                imagem[ordem[k]] = v
+                usado[v] = 1
+                if k + 1 == n:
+                    return imagem
+                pilha.append(candidatos(k + 1))
+                break
+        else:
+            pilha.pop()
+            if pilha:
+                u = ordem[len(pilha) - 1]
+                usado[imagem[u]] = 0
+                imagem[u] = -1
+    return None
+
+
 # ==================== FUNÇÃO PRINCIPAL ====================
 
 def verificar_isomorfismo(g1: Graph, g2: Graph, nome_g1: str = "G1", nome_g2: str = "G2", 
@@ -285,7 +783,8 @@ def verificar_isomorfismo(g1: Graph, g2: Graph, nome_g1: str = "G1", nome_g2: st
     Etapas hierárquicas:
     1. Condições necessárias (O(n + m)) - filtros rápidos
     2. Invariantes estruturais (O(n²)) - verificações intermediárias
-    3. Busca estrutural (O(n!)) - apenas para n ≤ 8
+    3. Refinamento de cores (1-WL) - partição estável comparada entre os grafos
+    4. Busca estrutural (estilo VF2) - qualquer n, candidatos restritos à mesma cor
     
     Args:
         g1: Primeiro grafo
@@ -296,11 +795,11 @@ def verificar_isomorfismo(g1: Graph, g2: Graph, nome_g1: str = "G1", nome_g2: st
     
     Returns:
         Tupla (são_isomorfos, explicação, mapeamento)
-        - são_isomorfos: True/False/None (None = indeterminado para grafos grandes)
+        - são_isomorfos: True/False
         - explicação: String descrevendo o resultado
         - mapeamento: Dicionário com correspondência de vértices (se isomorfos)
     
-    Complexity: O(n + m) a O(n!) dependendo do tamanho do grafo
+    Complexity: O(n + m) nos filtros; a busca é exponencial só no pior caso (grafos muito simétricos)
     
     Examples:
         >>> g1 = Graph(['A', 'B', 'C'], [('A', 'B'), ('B', 'C'), ('A', 'C')])
@@ -343,35 +842,126 @@ def verificar_isomorfismo(g1: Graph, g2: Graph, nome_g1: str = "G1", nome_g2: st
     if verbose:
         print(f"  [OK] {msg}")
     
-    # ETAPA 3: Busca estrutural
+    # ETAPA 3: Refinamento de cores
     if verbose:
-        print("\n[Etapa 3] Busca por mapeamento estrutural...")
+        print("\n[Etapa 3] Refinamento de cores (1-WL)...")
+    
+    possivel, msg, cores1, cores2 = refinamento_cores(g1, g2)
+    if not possivel:
+        if verbose:
+            print(f"  [FALHA] {msg}")
+            print(f"\n  CONCLUSÃO: {nome_g1} e {nome_g2} NÃO são isomorfos")
+        return False, msg, {}
+    
+    if verbose:
+        print(f"  [OK] {msg}")
+    
+    # ETAPA 4: Busca estrutural
+    if verbose:
+        print("\n[Etapa 4] Busca por mapeamento estrutural...")
     
     n = get_nodes_num(g=g1)
+    if verbose:
+        print(f"  Executando busca VF2 (n={n})...")
+    
+    iso, mapeamento = buscar_isomorfismo_vf2(g1, g2, cores1, cores2)
     
-    if n <= 8:
+    if iso:
         if verbose:
-            print(f"  Executando busca exaustiva (n={n} <= 8)...")
-        
-        iso, mapeamento = buscar_isomorfismo_forca_bruta(g1, g2)
-        
-        if iso:
-            if verbose:
-                print(f"  [OK] Isomorfismo encontrado!")
-                print(f"\n  CONCLUSÃO: {nome_g1} e {nome_g2} SÃO isomorfos")
-                print(f"\n  Mapeamento: {mapeamento}")
-            return True, "Isomorfismo confirmado", mapeamento
-        else:
-            if verbose:
-                print(f"  [FALHA] Nenhum isomorfismo encontrado após busca exaustiva")
-                print(f"\n  CONCLUSÃO: {nome_g1} e {nome_g2} NÃO são isomorfos")
-            return False, "Nenhum mapeamento válido encontrado", {}
+            print(f"  [OK] Isomorfismo encontrado!")
+            print(f"\n  CONCLUSÃO: {nome_g1} e {nome_g2} SÃO isomorfos")
+            print(f"\n  Mapeamento: {mapeamento}")
+        return True, "Isomorfismo confirmado", mapeamento
     else:
-        msg = f"Grafos grandes (n={n}). Condições necessárias satisfeitas mas verificação completa requer algoritmo especializado."
         if verbose:
-            print(f"  [AVISO] {msg}")
-            print(f"\n  CONCLUSÃO: Indeterminado (usar bibliotecas especializadas como NetworkX)")
-        return None, msg, {}
+            print(f"  [FALHA] Nenhum isomorfismo encontrado após busca completa")
+            print(f"\n  CONCLUSÃO: {nome_g1} e {nome_g2} NÃO são isomorfos")
+        return False, "Nenhum mapeamento válido encontrado", {}
+
+
+# ==================== CLASSIFICAÇÃO EM LOTE ====================
+
+def _assinatura_invariantes(g) -> Tuple[Tuple, List[int], List[set]]:
+    """
+    Calcula uma única vez, para um grafo, a chave de agrupamento (invariantes + histograma das cores
+    1-WL), as cores estáveis e a vizinhança por ids. Grafos isomorfos têm a mesma chave e cores
+    correspondentes (a numeração das cores é canônica).
+    """
+    inv = calcular_invariantes(g)
+    _, vizinhos = _adjacencias(g)
+    cor, _ = _refinar_cores(vizinhos)
+    chave = (inv['num_vertices'], inv['num_arestas'], inv['sequencia_graus'], inv.get('num_triangulos'),
+             tuple(sorted(Counter(cor).items())))
+    return chave, cor, vizinhos
+
+
+def _classificar_balde(itens: List[Tuple[List[set], List[int]]]) -> List[List[int]]:
+    """
+    Worker: separa um balde de grafos com a mesma chave em classes, comparando cada grafo só com o
+    representante (primeiro grafo) de cada classe já formada, pela busca VF2 restrita às cores 1-WL.
+    itens: (vizinhos, cores) de cada grafo. Retorna as classes como listas de posições no balde.
+    """
+    classes = []
+    for i, (vizinhos, cores) in enumerate(itens):
+        for classe in classes:
+            viz_r, cores_r = itens[classe[0]]
+            if _mapear_vf2(viz_r, vizinhos, cores_r, cores) is not None:
+                classe.append(i)
+                break
+        else:
+            classes.append([i])
+    return classes
+
+
+def classificar_isomorfismo(graphs: List, processes: int = None) -> Tuple[List[List[int]], Dict[str, float]]:
+    """
+    Particiona uma coleção de grafos em classes de isomorfismo.
+
+    Etapas:
+    1. invariantes: calculados uma vez por grafo (invariantes estruturais + refinamento 1-WL);
+    2. agrupamento: grafos com chaves diferentes não são isomorfos, então só se comparam grafos do
+       mesmo balde; baldes com um só grafo já são classes;
+    3. busca: cada balde restante é resolvido por _classificar_balde, com os baldes distribuídos
+       num pool de processos (maiores primeiro). Com 1 processo ou 1 balde tudo roda no processo atual.
+    Em Windows/macOS (spawn) a chamada deve ficar sob `if __name__ == '__main__':`.
+
+    Args:
+        graphs: lista de grafos (main.Graph ou grafos com nodes/neighbors)
+        processes: número de processos (padrão: número de CPUs, limitado ao número de baldes)
+
+    Returns:
+        Tupla (classes, tempos): classes é a lista de classes, cada uma com os índices dos grafos em
+        ordem crescente (classes ordenadas pelo primeiro índice); tempos traz a duração (s) de cada
+        etapa ('invariantes', 'agrupamento', 'busca') e o 'total'
+    """
+    inicio = time.perf_counter()
+    dados = [_assinatura_invariantes(g) for g in graphs]
+    t_invariantes = time.perf_counter()
+
+    baldes = {}
+    for i, (chave, _, _) in enumerate(dados):
+        baldes.setdefault(chave, []).append(i)
+    classes = [balde for balde in baldes.values() if len(balde) == 1]
+    pendentes = sorted((balde for balde in baldes.values() if len(balde) > 1), key=len, reverse=True)
+    tarefas = [[(dados[i][2], dados[i][1]) for i in balde] for balde in pendentes]
+    t_agrupamento = time.perf_counter()
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = max(1, min(processes, len(tarefas)))
+    if processes == 1:
+        resultados = [_classificar_balde(t) for t in tarefas]
+    else:
+        with Pool(processes) as pool:
+            resultados = pool.map(_classificar_balde, tarefas, chunksize=1)
+    for balde, locais in zip(pendentes, resultados):
+        classes.extend([balde[k] for k in classe] for classe in locais)
+    classes.sort(key=lambda classe: classe[0])
+    fim = time.perf_counter()
+
+    tempos = {'invariantes': t_invariantes - inicio, 'agrupamento': t_agrupamento - t_invariantes,
+              'busca': fim - t_agrupamento, 'total': fim - inicio}
+    return classes, tempos
 
 
 # ==================== CASOS DE TESTE ====================
@@ -436,7 +1026,7 @@ def criar_grafo_nao_isomorfo_k22() -> Graph:
     """K2,2 com uma aresta adicional (não isomorfo a C4)"""
     g = bipartido_completo(2, 2)
     # Adicionar aresta entre vértices do mesmo conjunto
-    g.edges.append(('a1', 'a2'))
+    g.add_edge('a1', 'a2')
     return g
 
 
@@ -472,9 +1062,9 @@ def visualizar_grafo(
     # Layout automático se não especificado
     if pos is None:
         if len(g.nodes) <= 5:
-            pos = nx.spring_layout(nx_g, k=2, iterations=100, seed=42)
+            pos = cached_spring_layout(g, nx_g, k=2, iterations=100, seed=42)
         else:
-            pos = nx.spring_layout(nx_g, k=1.5, iterations=100, seed=42)
+            pos = cached_spring_layout(g, nx_g, k=1.5, iterations=100, seed=42)
     
     # Desenhar arestas com estilo melhorado
     nx.draw_networkx_edges(
@@ -540,8 +1130,8 @@ def comparar_grafos(
     nx_g2 = graph_to_networkx(g2)
     
     # Layouts com seed para consistência
-    pos1 = nx.spring_layout(nx_g1, k=2, iterations=100, seed=42)
-    pos2 = nx.spring_layout(nx_g2, k=2, iterations=100, seed=42)
+    pos1 = cached_spring_layout(g1, nx_g1, k=2, iterations=100, seed=42)
+    pos2 = cached_spring_layout(g2, nx_g2, k=2, iterations=100, seed=42)
     
     # Cores baseadas no resultado
     if sao_isomorfos:
@@ -749,6 +1339,16 @@ def executar_casos_teste(gerar_imagens: bool = False, pasta_imagens: str = "visu
     print(f"\nResultado: {aprovados}/{len(resultados)} testes aprovados")
     print("="*80)
     
+    # Classificação em lote: invariantes uma vez por grafo, busca só dentro de cada balde
+    grafos = [caso[chave] for caso in casos for chave in ('g1', 'g2')]
+    nomes = [caso[chave] for caso in casos for chave in ('nome_g1', 'nome_g2')]
+    classes, tempos = classificar_isomorfismo(grafos, processes=1)
+    print(f"\nClassificação em lote dos {len(grafos)} grafos: {len(classes)} classes de isomorfismo")
+    for classe in classes:
+        print("  - " + ", ".join(nomes[i] for i in classe))
+    print("  Tempos: " + ", ".join(f"{etapa} {t * 1000:.2f} ms" for etapa, t in tempos.items()))
+    print("="*80)
+    
     # Gerar visualizações se solicitado
     if gerar_imagens:
         print("\n")
@@ -766,16 +1366,18 @@ def discutir_limitacoes():
     print("="*80)
     
     print("""
-1. GRAFOS GRANDES (n > 8):
-   - Busca exaustiva tem complexidade O(n!)
-   - Exemplo: n=10 -> 10! = 3.628.800 permutações
-   - Solução: usar algoritmos especializados (VF2, Weisfeiler-Lehman)
+1. GRAFOS GRANDES E MUITO SIMÉTRICOS:
+   - A busca VF2 é exponencial no pior caso
+   - Grafos esparsos típicos (milhares de vértices) resolvem em fração de segundo
+   - Grafos regulares/fortemente regulares grandes podem exigir muito backtracking
+   - O refinamento 1-WL ajuda, mas não separa vértices de grafos regulares
 
 2. GRAFOS REGULARES:
    - Todos os vértices têm o mesmo grau
    - Exemplos: K_n (completo), ciclos, hipercubos
-   - Problema: agrupamento por grau não reduz espaço de busca
-   - Solução: usar invariantes mais sofisticados
+   - Problema: nem o grau nem o refinamento 1-WL separam os vértices
+     (toda a partição fica com uma única cor)
+   - Solução: individualizar vértices e refinar de novo (estilo nauty)
 
 3. GRAFOS COM MUITA SIMETRIA:
    - Exemplos: grafos bipartidos completos, Petersen
@@ -795,18 +1397,18 @@ def discutir_limitacoes():
    - Implementação atual só trata grafos simples não-direcionados
    - Extensão requer adaptação dos invariantes
 
-7. CASOS INDETERMINÁVEIS:
-   - Para grafos grandes, retornamos "indeterminado"
-   - Não é "falso negativo", apenas reconhece limitação
+7. CUSTO SEM RESPOSTA PARCIAL:
+   - A busca sempre decide (isomorfo ou não), sem resposta "indeterminada"
+   - Em casos patológicos o tempo pode crescer muito antes da resposta
     """)
     
     print("="*80)
     print("RECOMENDAÇÕES:")
     print("="*80)
     print("""
-- Para grafos pequenos (n <= 8): usar esta implementação
-- Para grafos médios (8 < n <= 100): usar NetworkX (algoritmo VF2)
-- Para grafos grandes (n > 100): considerar heurísticas probabilísticas
+- Para grafos esparsos (inclusive com milhares de vértices): usar esta implementação
+- Para grafos regulares grandes: usar rotulação canônica com individualização
+- Para deduplicar muitos grafos: agrupar por certificado(), sem comparações par a par
 - Para grafos especiais: explorar propriedades específicas
     """)
     print("="*80)
@@ -825,7 +1427,7 @@ def main():
     print("""
 ESTRATÉGIA IMPLEMENTADA:
 
-A verificação de isomorfismo é feita em 3 etapas hierárquicas:
+A verificação de isomorfismo é feita em 4 etapas hierárquicas:
 
 1. CONDIÇÕES NECESSÁRIAS (O(n + m)):
    - Mesmo número de vértices
@@ -839,10 +1441,15 @@ A verificação de isomorfismo é feita em 3 etapas hierárquicas:
    - Grau máximo/mínimo
    >> Se falhar: grafos NÃO são isomorfos
 
-3. BUSCA ESTRUTURAL (O(n!), apenas n <= 8):
-   - Agrupa vértices por grau
-   - Testa permutações dentro de cada grupo
-   - Verifica preservação de adjacências
+3. REFINAMENTO DE CORES (1-WL, O(m log n)):
+   - Cor inicial = grau; a cada rodada, cor + cores dos vizinhos
+   - Compara o histograma de cores dos dois grafos
+   >> Se falhar: grafos NÃO são isomorfos
+
+4. BUSCA ESTRUTURAL (estilo VF2, qualquer n):
+   - Estende um mapeamento parcial um vértice por vez (ordem BFS)
+   - Só aceita pares com a mesma cor, grau e graus de vizinhos
+   - Verifica adjacências com os vizinhos já mapeados e volta atrás se falhar
    >> Se encontrar mapeamento: grafos SÃO isomorfos
    >> Se não encontrar: grafos NÃO são isomorfos
     """)
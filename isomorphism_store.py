@@ -0,0 +1,166 @@
+"""
+isomorphism_store.py
+Repositório persistente (SQLite) de classes de isomorfismo, indexado pelo certificado.
+
+Cada classe guarda o certificado (isomorphism.certificado) e a forma canônica, que serve de
+representante. Além disso, cada grafo já visto é registrado por uma chave barata do grafo
+rotulado (hash dos vértices e arestas com os rótulos originais): ao reprocessar os mesmos grafos
+em outra execução, a classe sai direto do banco, sem recalcular a rotulação canônica.
+
+Tabelas:
+- classes(id, certificado UNIQUE, n, arestas): arestas da forma canônica em JSON
+- grafos(chave PRIMARY KEY, classe): grafo rotulado -> classe
+As consultas são buscas por chave primária/índice (da ordem de microssegundos).
+"""
+
+from typing import Dict, Iterable, List, Optional
+import hashlib
+import json
+import sqlite3
+from main import Graph
+from isomorphism import rotulacao_canonica, _hash_forma_canonica
+
+VERSAO = 1
+TAMANHO_LOTE = 500  # chaves por consulta IN (...), abaixo do limite de parâmetros do SQLite
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS classes (
+    id INTEGER PRIMARY KEY,
+    certificado TEXT NOT NULL UNIQUE,
+    n INTEGER NOT NULL,
+    arestas TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS grafos (
+    chave TEXT PRIMARY KEY,
+    classe INTEGER NOT NULL REFERENCES classes(id)
+) WITHOUT ROWID;
+"""
+
+
+def chave_grafo(g) -> str:
+    """
+    Hash SHA-256 do grafo rotulado (rótulos via repr, vértices e arestas ordenados): identifica o
+    mesmo grafo entre execuções sem calcular a forma canônica. Custo O(n log n + m log m).
+    """
+    rotulos = [repr(v) for v in g.nodes]
+    arestas = sorted(tuple(sorted((rotulos[u], rotulos[w])))
+                     for u, viz in enumerate(_vizinhos_ids(g)) for w in viz if u <= w)
+    texto = json.dumps([sorted(rotulos), arestas], ensure_ascii=False)
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+
+def _vizinhos_ids(g) -> List:
+    if isinstance(g, Graph):
+        return g._adj
+    ids = {v: i for i, v in enumerate(g.nodes)}
+    return [[ids[w] for w in g.neighbors(v)] for v in g.nodes]
+
+
+class IsomorphismStore:
+    """
+    Classes de isomorfismo persistidas num arquivo SQLite (":memory:" para um banco temporário).
+    hits/misses contam as consultas respondidas pelo banco e as que precisaram calcular a forma
+    canônica. Pode ser usado como gerenciador de contexto (fecha a conexão na saída).
+    """
+    def __init__(self, filename: str = ":memory:"):
+        self.filename = filename
+        self.hits = 0
+        self.misses = 0
+        self.conn = sqlite3.connect(filename)
+        versao = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if versao not in (0, VERSAO):
+            self.conn.close()
+            raise ValueError(f"Versão {versao} do repositório não suportada (esperada {VERSAO})")
+        if filename != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.executescript(ESQUEMA)
+            self.conn.execute(f"PRAGMA user_version = {VERSAO}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __len__(self) -> int:
+        """Número de classes de isomorfismo armazenadas."""
+        return self.conn.execute("SELECT COUNT(*) FROM classes").fetchone()[0]
+
+    def lookup_certificate(self, certificado: str) -> Optional[int]:
+        """Id da classe com esse certificado, ou None."""
+        linha = self.conn.execute("SELECT id FROM classes WHERE certificado = ?", (certificado,)).fetchone()
+        return linha[0] if linha else None
+
+    def lookup(self, g) -> Optional[int]:
+        """
+        Id da classe de isomorfismo de g, ou None se nenhum grafo isomorfo foi armazenado.
+        Um grafo rotulado já visto é respondido pela chave (hit); senão a forma canônica é calculada
+        (miss) e, se a classe existir, o grafo é registrado para as próximas consultas.
+        """
+        return self._classificar(g, inserir=False)
+
+    def add(self, g) -> int:
+        """Id da classe de g, criando a classe (com g como representante) se ela ainda não existir."""
+        return self._classificar(g, inserir=True)
+
+    def _classificar(self, g, inserir: bool) -> Optional[int]:
+        chave = chave_grafo(g)
+        linha = self.conn.execute("SELECT classe FROM grafos WHERE chave = ?", (chave,)).fetchone()
+        if linha:
+            self.hits += 1
+            return linha[0]
+        with self.conn:
+            return self._registrar(g, chave, inserir)
+
+    def _registrar(self, g, chave: str, inserir: bool) -> Optional[int]:
+        """Miss: calcula a forma canônica e associa a chave à classe (dentro da transação do chamador)."""
+        self.misses += 1
+        rotulacao, arestas = rotulacao_canonica(g)
+        certificado = _hash_forma_canonica(len(rotulacao), arestas)
+        classe = self.lookup_certificate(certificado)
+        if classe is None:
+            if not inserir:
+                return None
+            classe = self.conn.execute("INSERT INTO classes (certificado, n, arestas) VALUES (?, ?, ?)",
+                                       (certificado, len(rotulacao), json.dumps(arestas))).lastrowid
+        self.conn.execute("INSERT OR IGNORE INTO grafos (chave, classe) VALUES (?, ?)", (chave, classe))
+        return classe
+
+    def add_many(self, graphs: Iterable) -> List[int]:
+        """
+        Classifica vários grafos de uma vez: as chaves são consultadas em lotes, a forma canônica só
+        é calculada para os grafos ainda não vistos e todas as inserções ocorrem numa única transação.
+        Retorna o id da classe de cada grafo, na ordem de entrada.
+        """
+        graphs = list(graphs)
+        chaves = [chave_grafo(g) for g in graphs]
+        conhecidas: Dict[str, int] = {}
+        for inicio in range(0, len(chaves), TAMANHO_LOTE):
+            lote = list(set(chaves[inicio:inicio + TAMANHO_LOTE]))
+            marcadores = ",".join("?" * len(lote))
+            conhecidas.update(self.conn.execute(
+                f"SELECT chave, classe FROM grafos WHERE chave IN ({marcadores})", lote))
+
+        resultado = []
+        with self.conn:
+            for g, chave in zip(graphs, chaves):
+                classe = conhecidas.get(chave)
+                if classe is None:
+                    classe = conhecidas[chave] = self._registrar(g, chave, True)
+                else:
+                    self.hits += 1
+                resultado.append(classe)
+        return resultado
+
+    def representative(self, classe: int) -> Graph:
+        """Representante da classe: a forma canônica, com vértices 0..n-1."""
+        linha = self.conn.execute("SELECT n, arestas FROM classes WHERE id = ?", (classe,)).fetchone()
+        if linha is None:
+            raise KeyError(f"Classe não encontrada: {classe}")
+        n, arestas = linha
+        return Graph(list(range(n)), [tuple(e) for e in json.loads(arestas)])
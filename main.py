@@ -1,9 +1,137 @@
 # grafo_repr.py
 # Implementações das conversões pedidas no Exercício 1 (sem bibliotecas, exceto networkx para visualizar)
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Iterable
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict, deque
+import sys
+import time
 import matplotlib.pyplot as plt
 import networkx as nx
 
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: apenas as representações matriciais vetorizadas dependem dele
+    np = None
+
+class LabelTable:
+    """
+    Tabela persistente de internamento rótulo <-> inteiro denso (0..n-1).
+    labels: lista de rótulos na ordem em que foram internados (o id de labels[i] é i)
+    ids: dicionário rótulo -> id
+    """
+    def __init__(self, labels: Iterable[Any] = ()):
+        self.labels = []
+        self.ids = {}
+        for v in labels:
+            self.intern(v)
+
+    def intern(self, label: Any) -> int:
+        """Retorna o id do rótulo, criando um novo id se ele ainda não existir."""
+        i = self.ids.get(label)
+        if i is None:
+            i = len(self.labels)
+            self.ids[label] = i
+            self.labels.append(label)
+        return i
+
+    def copy(self) -> 'LabelTable':
+        table = LabelTable()
+        table.labels = list(self.labels)
+        table.ids = dict(self.ids)
+        return table
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, label: Any) -> bool:
+        return label in self.ids
+
+
+# Orçamento padrão (em bytes, estimado) do cache de dados derivados de cada Graph
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Quantos itens de cada contêiner são medidos pela estimativa de tamanho (o resto é extrapolado)
+AMOSTRA_TAMANHO = 8
+
+def _estimate_size(obj: Any) -> int:
+    """
+    Estimativa (em bytes) da memória ocupada por obj, por amostragem: mede até AMOSTRA_TAMANHO itens
+    de cada lista, tupla, conjunto ou dicionário (recursivamente) e extrapola pela quantidade de itens,
+    então o custo não depende do tamanho do valor (uma matriz V x V custa ~AMOSTRA_TAMANHO² medições).
+    Inteiros pequenos, booleanos e None são objetos compartilhados e só contam o ponteiro.
+    """
+    if hasattr(obj, 'nbytes'):  # arrays NumPy
+        return int(obj.nbytes)
+    if obj is None or isinstance(obj, bool) or (isinstance(obj, int) and -5 <= obj <= 256):
+        return 0
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (dict, list, tuple, set, frozenset)) and len(obj):
+        itens = obj.items() if isinstance(obj, dict) else obj
+        medidos = 0
+        total = 0
+        for item in itens:
+            if isinstance(obj, dict):
+                total += _estimate_size(item[0]) + _estimate_size(item[1])
+            else:
+                total += _estimate_size(item)
+            medidos += 1
+            if medidos == AMOSTRA_TAMANHO:
+                break
+        size += total * len(obj) // medidos
+    return size
+
+
+class DerivedCache:
+    """
+    Memoização de dados derivados de um grafo (representações, graus, invariantes, layouts).
+    As entradas valem para uma versão do grafo (Graph.version): quando a versão muda, o cache
+    inteiro é descartado na próxima consulta. O tamanho total é limitado por max_bytes (estimado),
+    descartando as entradas menos usadas recentemente (LRU).
+    Os valores devolvidos são compartilhados entre as chamadas e não devem ser modificados.
+    """
+    def __init__(self, max_bytes: int = CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._version = None
+        self._items = OrderedDict()  # chave -> (valor, tamanho)
+
+    def get(self, version: int, key: Any, builder) -> Any:
+        """Retorna o valor de key para a versão dada, chamando builder() se ele não estiver no cache."""
+        if version != self._version:
+            self.clear()
+            self._version = version
+        item = self._items.get(key)
+        if item is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+        self.misses += 1
+        value = builder()
+        size = _estimate_size(value)
+        if size <= self.max_bytes:
+            self._items[key] = (value, size)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                _, (_, old_size) = self._items.popitem(last=False)
+                self.total_bytes -= old_size
+        return value
+
+    def invalidate(self, key: Any = None) -> None:
+        """Descarta a entrada key (ou todas, se key for None)."""
+        if key is None:
+            self.clear()
+        elif key in self._items:
+            _, size = self._items.pop(key)
+            self.total_bytes -= size
+
+    def clear(self) -> None:
+        self._items.clear()
+        self.total_bytes = 0
+
+
 class Graph:
     """
     Representa um grafo simples não-direcionado, possivelmente com pesos nas arestas.
@@ -11,34 +139,430 @@ class Graph:
     edges: lista de tuplas (u, v) com u, v em nodes
     weights: dicionário opcional que mapeia arestas (u, v) para seus pesos
     Observações: armazena arestas como (u, v) com u and v nos rótulos originais.
+    Internamente cada rótulo é internado em um id inteiro denso (labels, uma LabelTable cuja
+    lista de rótulos é o próprio nodes) e o índice de vizinhança _adj é uma lista indexada por id,
+    com os vizinhos de cada vértice também como ids. Os rótulos só aparecem na interface pública.
+    Vértices que aparecem apenas nas arestas são acrescentados ao final de nodes.
+    Alterações devem ser feitas pelos métodos add_node/remove_node/add_edge/remove_edge/set_weight
+    (e não diretamente em nodes/edges), que mantêm o índice consistente e incrementam version,
+    usado por quem guarda dados derivados do grafo para detectar que eles ficaram desatualizados.
     """
-    def __init__(self, nodes: List[Any], edges: List[Tuple[Any, Any]], weights: Dict[Tuple[Any, Any], float] = None):
-        self.nodes = list(nodes)
-        # normalizar arestas: ordenar par (menor, maior) para grafos não-direcionados
-        normalized = []
+    def __init__(self, nodes: List[Any], edges: Iterable[Tuple[Any, Any]], weights: Dict[Tuple[Any, Any], float] = None):
+        self.labels = LabelTable(nodes)
+        self.nodes = self.labels.labels
+        self.edges = []
         self.weights = {}
+        self.version = 0
+        self._cache = None  # DerivedCache, criado na primeira consulta
+        self._adj = [{} for _ in self.nodes]
+        self._edge_pos = None  # par de ids (menor, maior) -> posição em edges; criado na primeira remoção
+        # normalizar arestas em O(n + m): o índice de vizinhança detecta duplicatas (u,v) e (v,u)
         for (u, v) in edges:
-            if u == v:
-                normalized.append((u, v))  # loop permitido
-                if weights and (u, v) in weights:
-                    self.weights[(u, v)] = weights[(u, v)]
+            w = None
+            if weights:
+                w = weights.get((u, v)) if u == v else (weights.get((u, v)) or weights.get((v, u)))
+            self._insert_edge(u, v, w)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable, weights: Dict[Tuple[Any, Any], float] = None, nodes: Iterable[Any] = None) -> 'Graph':
+        """
+        Constrói um grafo em O(n + m) consumindo edges uma única vez (aceita geradores e arrays).
+        Cada item de edges pode ser (u, v) ou (u, v, peso); weights é um dicionário opcional de pesos.
+        Se nodes for None, os vértices são inferidos na ordem em que aparecem nas arestas.
+        Arestas repetidas não são duplicadas e, como em add_edge, o último peso dado prevalece.
+        """
+        g = cls(nodes if nodes is not None else [], [])
+        ids = g.labels.ids
+        for edge in edges:
+            if len(edge) == 3:
+                u, v, w = edge
             else:
-                # manter ordem consistente para evitar duplicatas (u,v) e (v,u)
-                if u is None or v is None:
-                    raise ValueError("Aresta com vértice None")
-                if (u, v) not in normalized and (v, u) not in normalized:
-                    normalized.append((u, v))
-                    # adicionar peso se fornecido
-                    if weights:
-                        w = weights.get((u, v)) or weights.get((v, u))
-                        if w is not None:
-                            self.weights[(u, v)] = w
-        self.edges = normalized
+                u, v = edge
+                w = None
+                if weights:
+                    w = weights.get((u, v)) if u == v else (weights.get((u, v)) or weights.get((v, u)))
+            if not g._insert_edge(u, v, w) and w is not None:
+                g.weights[g.edges[g._edge_position(ids[u], ids[v])]] = w
+        return g
+
+    def _intern(self, v: Any) -> int:
+        """Retorna o id de v, acrescentando-o como novo vértice se necessário."""
+        i = self.labels.intern(v)
+        if i == len(self._adj):
+            self._adj.append({})
+        return i
+
+    def _insert_edge(self, u: Any, v: Any, w: float = None) -> bool:
+        """
+        Insere a aresta (u, v) se ela ainda não existir (em qualquer orientação), em O(1).
+        O índice de vizinhança é um dicionário de ids usado como conjunto ordenado, e loops
+        aparecem uma única vez na vizinhança do próprio vértice. Retorna True se a aresta foi inserida.
+        """
+        if u != v and (u is None or v is None):
+            raise ValueError("Aresta com vértice None")
+        i, j = self._intern(u), self._intern(v)
+        vizinhos_i = self._adj[i]
+        if j in vizinhos_i:
+            return False
+        vizinhos_i[j] = None
+        self._adj[j][i] = None
+        if self._edge_pos is not None:
+            self._edge_pos[(i, j) if i <= j else (j, i)] = len(self.edges)
+        self.edges.append((u, v))
+        if w is not None:
+            self.weights[(u, v)] = w
+        return True
+
+    # ---------- API de alteração (O(1) amortizado por aresta) ----------
+
+    def add_node(self, v: Any) -> None:
+        """Acrescenta o vértice v (sem efeito se ele já existir)."""
+        if v not in self.labels:
+            self._intern(v)
+            self.version += 1
+
+    def add_edge(self, u: Any, v: Any, weight: float = None) -> None:
+        """
+        Acrescenta a aresta (u, v), criando os vértices que ainda não existirem.
+        Se a aresta já existir e weight for fornecido, apenas atualiza o peso.
+        """
+        if self._insert_edge(u, v, weight):
+            self.version += 1
+        elif weight is not None:
+            self.set_weight(u, v, weight)
+
+    def add_edges_from(self, edges: Iterable) -> None:
+        """
+        Acrescenta várias arestas, cada uma no formato (u, v) ou (u, v, peso), consumindo edges
+        uma única vez (aceita geradores); version é incrementada uma vez para o lote inteiro.
+        """
+        inseriu = False
+        ids, rotulos, vizinhos, lista, pesos = self.labels.ids, self.labels.labels, self._adj, self.edges, self.weights
+        for edge in edges:
+            u, v = edge[0], edge[1]
+            w = edge[2] if len(edge) == 3 else None
+            if u != v and (u is None or v is None):
+                raise ValueError("Aresta com vértice None")
+            # internamento inline (ver LabelTable.intern e _intern)
+            i = ids.get(u)
+            if i is None:
+                i = ids[u] = len(rotulos)
+                rotulos.append(u)
+                vizinhos.append({})
+            j = ids.get(v)
+            if j is None:
+                j = ids[v] = len(rotulos)
+                rotulos.append(v)
+                vizinhos.append({})
+            if j not in vizinhos[i]:
+                vizinhos[i][j] = None
+                vizinhos[j][i] = None
+                if self._edge_pos is not None:
+                    self._edge_pos[(i, j) if i <= j else (j, i)] = len(lista)
+                lista.append((u, v))
+                if w is not None:
+                    pesos[(u, v)] = w
+                inseriu = True
+            elif w is not None:
+                self.set_weight(u, v, w)
+        if inseriu:
+            self.version += 1
+
+    def _add_edges_by_id(self, heads: Iterable[int], tails: Iterable[int], pesos: Iterable[float] = None) -> None:
+        """
+        Como add_edges_from, mas com as arestas já em ids (vértices já internados em labels):
+        a aresta k é (heads[k], tails[k]) e pesos, se dado, tem o peso de cada uma (NaN = sem peso).
+        Não há busca de rótulos por aresta, só indexação da lista de rótulos.
+        """
+        inseriu = False
+        rotulos, vizinhos, lista, pesos_g = self.labels.labels, self._adj, self.edges, self.weights
+        for k, (i, j) in enumerate(zip(heads, tails)):
+            w = pesos[k] if pesos is not None else None
+            if w is not None and w != w:
+                w = None
+            if j not in vizinhos[i]:
+                vizinhos[i][j] = None
+                vizinhos[j][i] = None
+                if self._edge_pos is not None:
+                    self._edge_pos[(i, j) if i <= j else (j, i)] = len(lista)
+                lista.append((rotulos[i], rotulos[j]))
+                if w is not None:
+                    pesos_g[lista[-1]] = w
+                inseriu = True
+            elif w is not None:
+                pesos_g[lista[self._edge_position(i, j)]] = w
+                inseriu = True
+        if inseriu:
+            self.version += 1
+
+    def _edge_position(self, i: int, j: int) -> int:
+        """Posição da aresta {i, j} em edges (constrói o mapa de posições na primeira chamada)."""
+        if self._edge_pos is None:
+            ids = self.labels.ids
+            self._edge_pos = {}
+            for k, (u, v) in enumerate(self.edges):
+                a, b = ids[u], ids[v]
+                self._edge_pos[(a, b) if a <= b else (b, a)] = k
+        return self._edge_pos[(i, j) if i <= j else (j, i)]
+
+    def remove_edge(self, u: Any, v: Any) -> None:
+        """
+        Remove a aresta (u, v) em O(1): a última aresta de edges ocupa a posição da removida.
+        Lança KeyError se a aresta não existir.
+        """
+        if not self.has_edge(u, v):
+            raise KeyError(f"Aresta inexistente: ({u}, {v})")
+        ids = self.labels.ids
+        i, j = ids[u], ids[v]
+        pos = self._edge_position(i, j)
+        removida = self.edges[pos]
+        ultima = self.edges.pop()
+        if pos < len(self.edges):
+            self.edges[pos] = ultima
+            a, b = ids[ultima[0]], ids[ultima[1]]
+            self._edge_pos[(a, b) if a <= b else (b, a)] = pos
+        del self._edge_pos[(i, j) if i <= j else (j, i)]
+        self.weights.pop(removida, None)
+        del self._adj[i][j]
+        self._adj[j].pop(i, None)
+        self.version += 1
+
+    def remove_node(self, v: Any) -> None:
+        """
+        Remove o vértice v e suas arestas em O(grau(v) + grau(último vértice)).
+        Para manter os ids densos, o último vértice de nodes passa a ocupar a posição de v.
+        Lança KeyError se o vértice não existir.
+        """
+        ids = self.labels.ids
+        i = ids[v]
+        for k in list(self._adj[i]):
+            self.remove_edge(v, self.nodes[k])
+        last = len(self.nodes) - 1
+        if i != last:
+            # renumera o último vértice (id last -> i) no índice e no mapa de posições
+            label_last = self.nodes[last]
+            vizinhos_last = self._adj[last]
+            for k in vizinhos_last:
+                if k != last:
+                    del self._adj[k][last]
+                    self._adj[k][i] = None
+                if self._edge_pos is not None:
+                    pos = self._edge_pos.pop((k, last) if k <= last else (last, k))
+                    novo = i if k == last else k
+                    self._edge_pos[(novo, i) if novo <= i else (i, novo)] = pos
+            if last in vizinhos_last:
+                del vizinhos_last[last]
+                vizinhos_last[i] = None
+            self._adj[i] = vizinhos_last
+            self.nodes[i] = label_last
+            ids[label_last] = i
+        self._adj.pop()
+        self.nodes.pop()
+        del ids[v]
+        self.version += 1
+
+    def set_weight(self, u: Any, v: Any, weight: float) -> None:
+        """Define o peso da aresta existente (u, v). Lança KeyError se a aresta não existir."""
+        if not self.has_edge(u, v):
+            raise KeyError(f"Aresta inexistente: ({u}, {v})")
+        ids = self.labels.ids
+        chave = self.edges[self._edge_position(ids[u], ids[v])]
+        self.weights[chave] = weight
+        self.version += 1
+
+    def neighbors(self, v: Any) -> List[Any]:
+        """Retorna a lista de vizinhos de v em O(grau(v))."""
+        i = self.labels.ids.get(v)
+        if i is None:
+            return []
+        nodes = self.nodes
+        return [nodes[j] for j in self._adj[i]]
+
+    def has_edge(self, u: Any, v: Any) -> bool:
+        """Verifica em O(1) se existe aresta entre u e v."""
+        ids = self.labels.ids
+        i, j = ids.get(u), ids.get(v)
+        return i is not None and j is not None and j in self._adj[i]
+
+    def degree(self, v: Any) -> int:
+        """Retorna o grau de v em O(1) (um loop conta duas vezes, como na matriz de incidência)."""
+        i = self.labels.ids.get(v)
+        if i is None:
+            return 0
+        return self._degree_idx(i)
+
+    def _degree_idx(self, i: int) -> int:
+        vizinhos = self._adj[i]
+        return len(vizinhos) + (1 if i in vizinhos else 0)
+
+    def has_node(self, v: Any) -> bool:
+        """Verifica em O(1) se v é vértice do grafo."""
+        return v in self.labels
+
+    @property
+    def vertices(self) -> List[Any]:
+        """Sinônimo de nodes (nome usado pelo menu e pelos scripts de análise)."""
+        return self.nodes
+
+    def cached(self, key: Any, builder) -> Any:
+        """
+        Retorna o dado derivado identificado por key, calculando-o com builder() apenas se ele
+        não estiver no cache da versão atual do grafo (ver DerivedCache).
+        """
+        if self._cache is None:
+            self._cache = DerivedCache()
+        return self._cache.get(self.version, key, builder)
+
+    def invalidate_cache(self, key: Any = None) -> None:
+        """Descarta explicitamente o dado derivado key (ou todos, se key for None)."""
+        if self._cache is not None:
+            self._cache.invalidate(key)
+
+    def freeze(self) -> 'FrozenGraph':
+        """Retorna uma cópia imutável do grafo em formato CSR (ver FrozenGraph)."""
+        return FrozenGraph.from_graph(self)
 
     def __repr__(self):
         return f"Graph(nodes={self.nodes}, edges={self.edges})"
 
 
+class FrozenGraph:
+    """
+    Grafo imutável em formato CSR (compressed sparse row), para cargas de trabalho só de leitura.
+    nodes: lista de rótulos; o vértice de índice i é nodes[i]
+    offsets: array 'q' com n + 1 posições; os vizinhos de i ocupam targets[offsets[i]:offsets[i + 1]]
+    targets: array 'i' (int32) com os índices dos vizinhos, ordenados dentro de cada linha
+    edge_weights: array 'd' (float64) paralelo a targets, ou None se o grafo não tiver pesos
+                  (NaN indica aresta sem peso)
+    Cada aresta ocupa duas posições de targets (uma em cada extremidade); loops ocupam uma.
+    offsets, targets e edge_weights podem ser quaisquer sequências indexáveis com esses tipos
+    (por exemplo memoryviews sobre um arquivo mapeado, ver graph_binary); num_edges, se conhecido,
+    evita a contagem de loops na construção.
+    """
+    def __init__(self, nodes: Any, offsets: array, targets: array, edge_weights: array = None, num_edges: int = None):
+        # nodes pode ser uma lista de rótulos ou uma LabelTable já construída
+        self.labels = nodes if isinstance(nodes, LabelTable) else LabelTable(nodes)
+        self.nodes = self.labels.labels
+        if len(offsets) != len(self.nodes) + 1:
+            raise ValueError("offsets deve ter len(nodes) + 1 posições")
+        self.offsets = offsets
+        self.targets = targets
+        self.edge_weights = edge_weights
+        if num_edges is None:
+            loops = sum(1 for i in range(len(self.nodes)) if self._has_edge_idx(i, i))
+            num_edges = (len(targets) + loops) // 2
+        self.num_edges = num_edges
+
+    @classmethod
+    def from_graph(cls, g: Graph) -> 'FrozenGraph':
+        """Empacota um Graph em formato CSR em O(n + m log(grau))."""
+        nodes = g.nodes
+        offsets = array('q', [0])
+        targets = array('i')
+        edge_weights = array('d') if g.weights else None
+        for i, u in enumerate(nodes):
+            row = sorted(g._adj[i])
+            targets.extend(row)
+            offsets.append(len(targets))
+            if edge_weights is not None:
+                for j in row:
+                    v = nodes[j]
+                    w = g.weights.get((u, v))
+                    if w is None:
+                        w = g.weights.get((v, u))
+                    edge_weights.append(float('nan') if w is None else w)
+        return cls(g.labels.copy(), offsets, targets, edge_weights)
+
+    @classmethod
+    def from_adj_array(cls, M, nodes: List[Any] = None) -> 'FrozenGraph':
+        """
+        Constrói o CSR direto de uma matriz de adjacência ndarray (inclusive np.memmap), sem passar
+        por Graph: lê M em faixas de linhas e usa só o triângulo superior, como adj_matrix_to_graph.
+        """
+        n = M.shape[0]
+        if nodes is None:
+            nodes = list(range(n))
+        if len(nodes) != n:
+            raise ValueError("Tamanho da lista de vértices não bate com M")
+        faixas = list(_triangulo_superior_np(M))
+        rows = np.concatenate([r for r, c in faixas] or [np.zeros(0, dtype=np.int64)])
+        cols = np.concatenate([c for r, c in faixas] or [np.zeros(0, dtype=np.int64)])
+        fora = rows != cols  # loops ocupam uma única posição
+        origem = np.concatenate((rows, cols[fora]))
+        destino = np.concatenate((cols, rows[fora]))
+        ordem = np.lexsort((destino, origem))
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(origem, minlength=n), out=offsets[1:])
+        return cls(nodes, array('q', offsets.tobytes()),
+                   array('i', destino[ordem].astype(np.int32).tobytes()), num_edges=len(rows))
+
+    def to_graph(self) -> Graph:
+        """Converte de volta para um Graph mutável."""
+        return Graph(self.nodes, self.edges, self.weights)
+
+    def _has_edge_idx(self, i: int, j: int) -> bool:
+        """Busca binária de j na linha i."""
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        k = bisect_left(self.targets, j, lo, hi)
+        return k < hi and self.targets[k] == j
+
+    def neighbors(self, v: Any) -> List[Any]:
+        """Retorna a lista de vizinhos de v em O(grau(v))."""
+        i = self.labels.ids.get(v)
+        if i is None:
+            return []
+        nodes = self.nodes
+        return [nodes[j] for j in self.targets[self.offsets[i]:self.offsets[i + 1]]]
+
+    def has_edge(self, u: Any, v: Any) -> bool:
+        """Verifica em O(log grau(u)) se existe aresta entre u e v."""
+        ids = self.labels.ids
+        i, j = ids.get(u), ids.get(v)
+        if i is None or j is None:
+            return False
+        return self._has_edge_idx(i, j)
+
+    def degree(self, v: Any) -> int:
+        """Retorna o grau de v pela diferença de offsets (um loop conta duas vezes)."""
+        i = self.labels.ids.get(v)
+        if i is None:
+            return 0
+        return self._degree_idx(i)
+
+    def _degree_idx(self, i: int) -> int:
+        return self.offsets[i + 1] - self.offsets[i] + (1 if self._has_edge_idx(i, i) else 0)
+
+    def has_node(self, v: Any) -> bool:
+        """Verifica em O(1) se v é vértice do grafo."""
+        return v in self.labels
+
+    @property
+    def edges(self) -> List[Tuple[Any, Any]]:
+        """Lista de arestas (u, v), gerada sob demanda a partir do CSR (cada aresta uma vez)."""
+        nodes, offsets, targets = self.nodes, self.offsets, self.targets
+        return [(nodes[i], nodes[j])
+                for i in range(len(nodes))
+                for j in targets[offsets[i]:offsets[i + 1]] if i <= j]
+
+    @property
+    def weights(self) -> Dict[Tuple[Any, Any], float]:
+        """Dicionário de pesos, gerado sob demanda (vazio se o grafo não tiver pesos)."""
+        if self.edge_weights is None:
+            return {}
+        nodes, offsets, targets = self.nodes, self.offsets, self.targets
+        result = {}
+        for i in range(len(nodes)):
+            for k in range(offsets[i], offsets[i + 1]):
+                j = targets[k]
+                w = self.edge_weights[k]
+                if i <= j and w == w:  # w != w apenas para NaN (sem peso)
+                    result[(nodes[i], nodes[j])] = w
+        return result
+
+    def __repr__(self):
+        return f"FrozenGraph(n={len(self.nodes)}, m={self.num_edges})"
+
+
 # 1) Dado um grafo, gere sua matriz de adjacência
 def graph_to_adj_matrix(g: Graph) -> List[List[int]]:
     """
@@ -46,7 +570,7 @@ def graph_to_adj_matrix(g: Graph) -> List[List[int]]:
     As linhas/colunas seguem a ordem de g.nodes.
     """
     n = len(g.nodes)
-    idx = {v: i for i, v in enumerate(g.nodes)}
+    idx = g.labels.ids
     M = [[0 for _ in range(n)] for __ in range(n)]
     for (u, v) in g.edges:
         i, j = idx[u], idx[v]
@@ -54,12 +578,56 @@ def graph_to_adj_matrix(g: Graph) -> List[List[int]]:
         M[j][i] = 1  # não-direcionado
     return M
 
+def _is_array(obj: Any) -> bool:
+    """Indica se obj é uma matriz NumPy (representação matricial vetorizada)."""
+    return np is not None and isinstance(obj, np.ndarray)
+
+def graph_to_adj_matrix_np(g: Graph, dtype: Any = None, packed: bool = False):
+    """
+    Versão NumPy de graph_to_adj_matrix: retorna uma matriz NxN (dtype uint8 por padrão, ou bool)
+    construída por indexação vetorizada sobre os ids das arestas.
+    Se packed for True, retorna a matriz compactada em bits por linha (np.packbits, 1 bit por célula);
+    use unpack_adj_matrix para voltar à forma densa antes das consultas.
+    """
+    if np is None:
+        raise ImportError("NumPy não está instalado. Para instalar, execute: pip install numpy")
+    n = len(g.nodes)
+    idx = g.labels.ids
+    rows = np.fromiter((idx[u] for (u, v) in g.edges), dtype=np.int64, count=len(g.edges))
+    cols = np.fromiter((idx[v] for (u, v) in g.edges), dtype=np.int64, count=len(g.edges))
+    M = np.zeros((n, n), dtype=dtype or np.uint8)
+    M[rows, cols] = 1
+    M[cols, rows] = 1  # não-direcionado
+    if packed:
+        return np.packbits(M.astype(bool), axis=1)
+    return M
+
+def unpack_adj_matrix(P, n: int):
+    """Desfaz a compactação em bits de graph_to_adj_matrix_np(..., packed=True), retornando uint8 NxN."""
+    return np.unpackbits(P, axis=1, count=n)
+
 # 2) Dada a matriz de adjacência, gere o grafo correspondente
 def adj_matrix_to_graph(M: List[List[int]], nodes: List[Any] = None) -> Graph:
     """
     Recebe matriz quadrada M (lista de listas). Se nodes for None, usa rótulos 0..n-1.
     Constrói arestas (i, j) para cada entrada M[i][j] != 0 com i <= j (evita duplicatas).
+    M também pode ser um ndarray (inclusive np.memmap), percorrido em faixas de linhas, ou o
+    FrozenGraph devolvido por matrix_input.read_matrix_np para matrizes esparsas.
     """
+    if isinstance(M, FrozenGraph):
+        if nodes is not None and list(nodes) != M.nodes:
+            return Graph(nodes, [(nodes[M.labels.ids[u]], nodes[M.labels.ids[v]]) for (u, v) in M.edges])
+        return M.to_graph()
+    if _is_array(M):
+        if M.ndim != 2 or M.shape[0] != M.shape[1]:
+            raise ValueError("M deve ser uma matriz quadrada")
+        if nodes is None:
+            nodes = list(range(M.shape[0]))
+        if len(nodes) != M.shape[0]:
+            raise ValueError("Tamanho da lista de vértices não bate com M")
+        return Graph.from_edges(((nodes[i], nodes[j])
+                                 for rows, cols in _triangulo_superior_np(M)
+                                 for i, j in zip(rows.tolist(), cols.tolist())), nodes=nodes)
     n = len(M)
     if nodes is None:
         nodes = list(range(n))
@@ -73,6 +641,38 @@ def adj_matrix_to_graph(M: List[List[int]], nodes: List[Any] = None) -> Graph:
                 edges.append((nodes[i], nodes[j]))
     return Graph(nodes, edges)
 
+def _triangulo_superior_np(M, faixa: int = 4096):
+    """
+    Gera, por faixas de faixa linhas, os pares (linhas, colunas) das entradas não nulas de M com
+    linha <= coluna; a memória extra é proporcional à faixa, não à matriz inteira.
+    """
+    for r0 in range(0, M.shape[0], faixa):
+        rows, cols = np.nonzero(M[r0:r0 + faixa])
+        rows += r0
+        manter = cols >= rows
+        yield rows[manter], cols[manter]
+
+def _incidencia_np(I):
+    """
+    Extrai de uma matriz de incidência ndarray os vetores (heads, tails) de SparseIncidence,
+    vetorizado, com as mesmas regras e mensagens de erro de incidence_matrix_to_graph.
+    """
+    ncols = I.shape[1]
+    rows, cols = np.nonzero(I)
+    ordem = np.argsort(cols, kind='stable')
+    rows, cols = rows[ordem], cols[ordem]
+    counts = np.bincount(cols, minlength=ncols)
+    inicio = np.cumsum(counts) - counts
+    ruins = np.flatnonzero((counts == 0) | (counts > 2))
+    unico = np.flatnonzero(counts == 1)
+    unico_ruim = unico[I[rows[inicio[unico]], unico] != 2]
+    if ruins.size or unico_ruim.size:
+        col = min(ruins[:1].tolist() + unico_ruim[:1].tolist())
+        if counts[col] == 1:
+            raise ValueError(f"Coluna {col}: único valor de incidência diferente de 0 mas não é 2.")
+        raise ValueError(f"Coluna {col}: número de vértices incidentes = {counts[col]} (não é 1 nem 2).")
+    return rows[inicio], rows[inicio + counts - 1]
+
 # 3) Dado um grafo, gere sua matriz de incidência
 def graph_to_incidence_matrix(g: Graph) -> List[List[int]]:
     """
@@ -80,7 +680,7 @@ def graph_to_incidence_matrix(g: Graph) -> List[List[int]]:
     Para aresta (u,v): coloca 1 em linha u e 1 em linha v. Para loop (u,u) coloca 2 (incidência dupla).
     """
     v_list = g.nodes
-    idx = {v: i for i, v in enumerate(v_list)}
+    idx = g.labels.ids
     m = len(v_list)
     e = len(g.edges)
     I = [[0 for _ in range(e)] for __ in range(m)]
@@ -98,10 +698,15 @@ def incidence_matrix_to_graph(I: List[List[int]], nodes: List[Any] = None) -> Gr
     Recebe matriz de incidência I (linhas = vértices, colunas = arestas).
     Cada coluna deve ter exatamente dois '1's (arestas normais) ou um '2' (loop).
     nodes opcional: rótulos das linhas; se None, usa 0..m-1.
+    I também pode ser um ndarray (processado de forma vetorizada) ou uma SparseIncidence.
     """
+    if isinstance(I, SparseIncidence):
+        return sparse_incidence_to_graph(I, nodes)
     m = len(I)
     if m == 0:
         return Graph([], [])
+    if _is_array(I):
+        return sparse_incidence_to_graph(SparseIncidence.from_dense(I, nodes))
     ncols = len(I[0])
     if nodes is None:
         nodes = list(range(m))
@@ -133,38 +738,159 @@ def incidence_matrix_to_graph(I: List[List[int]], nodes: List[Any] = None) -> Gr
             raise ValueError(f"Coluna {col}: número de vértices incidentes = {len(incident)} (não é 1 nem 2).")
     return Graph(nodes, edges)
 
+class SparseIncidence:
+    """
+    Matriz de incidência esparsa (formato CSC com exatamente duas linhas por coluna).
+    nodes: rótulos das linhas (vértices)
+    heads, tails: arrays 'i' com uma posição por coluna; a coluna e liga as linhas heads[e] e tails[e]
+                  (heads[e] == tails[e] representa um loop, que vale 2 na forma densa)
+    Nenhuma célula nula é armazenada: conversões custam O(n + m) e as consultas por linha usam um
+    índice linha -> colunas construído sob demanda.
+    """
+    def __init__(self, nodes: List[Any], heads: array, tails: array):
+        if len(heads) != len(tails):
+            raise ValueError("heads e tails devem ter o mesmo tamanho")
+        self.nodes = list(nodes)
+        self.heads = heads
+        self.tails = tails
+        self._row_offsets = None
+        self._row_cols = None
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def num_cols(self) -> int:
+        return len(self.heads)
+
+    @classmethod
+    def from_dense(cls, I: List[List[int]], nodes: List[Any] = None) -> 'SparseIncidence':
+        """
+        Converte uma matriz de incidência densa (lista de listas ou ndarray), com as mesmas regras
+        de incidence_matrix_to_graph.
+        """
+        m = len(I)
+        if nodes is None:
+            nodes = list(range(m))
+        if len(nodes) != m:
+            raise ValueError("Tamanho dos vértices não coincide com número de linhas em I")
+        if _is_array(I):
+            if I.ndim != 2:
+                raise ValueError("I deve ser uma matriz")
+            heads, tails = _incidencia_np(I)
+            return cls(nodes, array('i', heads.astype(np.int32).tobytes()), array('i', tails.astype(np.int32).tobytes()))
+        ncols = len(I[0]) if m else 0
+        incident = [[] for _ in range(ncols)]
+        for row in range(m):
+            for col, val in enumerate(I[row]):
+                if val != 0:
+                    incident[col].append((row, val))
+        heads, tails = array('i'), array('i')
+        for col, cells in enumerate(incident):
+            if len(cells) == 1 and cells[0][1] == 2:
+                heads.append(cells[0][0])
+                tails.append(cells[0][0])
+            elif len(cells) == 2:
+                heads.append(cells[0][0])
+                tails.append(cells[1][0])
+            elif len(cells) == 1:
+                raise ValueError(f"Coluna {col}: único valor de incidência diferente de 0 mas não é 2.")
+            else:
+                raise ValueError(f"Coluna {col}: número de vértices incidentes = {len(cells)} (não é 1 nem 2).")
+        return cls(nodes, heads, tails)
+
+    def to_dense(self) -> List[List[int]]:
+        """Gera a matriz densa V x E (mesmo formato de graph_to_incidence_matrix)."""
+        I = [[0] * self.num_cols for _ in range(self.num_rows)]
+        for col, (a, b) in enumerate(zip(self.heads, self.tails)):
+            if a == b:
+                I[a][col] = 2
+            else:
+                I[a][col] = 1
+                I[b][col] = 1
+        return I
+
+    def _build_row_index(self):
+        """Índice linha -> colunas incidentes (CSR da transposta), construído em O(n + m)."""
+        n = self.num_rows
+        counts = [0] * (n + 1)
+        for a, b in zip(self.heads, self.tails):
+            counts[a + 1] += 1
+            if a != b:
+                counts[b + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+        offsets = array('q', counts)
+        cols = array('i', bytes(4 * counts[n]))
+        fill = list(counts[:n])
+        for col, (a, b) in enumerate(zip(self.heads, self.tails)):
+            cols[fill[a]] = col
+            fill[a] += 1
+            if a != b:
+                cols[fill[b]] = col
+                fill[b] += 1
+        self._row_offsets, self._row_cols = offsets, cols
+
+    def columns_of(self, row: int) -> List[int]:
+        """Colunas (arestas) incidentes à linha row, sem percorrer células nulas."""
+        if self._row_offsets is None:
+            self._build_row_index()
+        return self._row_cols[self._row_offsets[row]:self._row_offsets[row + 1]].tolist()
+
+    def neighbors(self, row: int) -> List[int]:
+        """Linhas adjacentes a row, na ordem das colunas (loop aparece uma vez, como no caso denso)."""
+        result = []
+        for col in self.columns_of(row):
+            a, b = self.heads[col], self.tails[col]
+            result.append(b if a == row else a)
+        return result
+
+    def degrees(self) -> List[int]:
+        """Número de vizinhos de cada linha, em uma única passada pelas colunas."""
+        graus = [0] * self.num_rows
+        for a, b in zip(self.heads, self.tails):
+            graus[a] += 1
+            if a != b:
+                graus[b] += 1
+        return graus
+
+    def __repr__(self):
+        return f"SparseIncidence(rows={self.num_rows}, cols={self.num_cols})"
+
+def graph_to_sparse_incidence(g: Graph) -> SparseIncidence:
+    """Versão esparsa de graph_to_incidence_matrix: uma coluna por aresta, em O(n + m)."""
+    idx = g.labels.ids
+    heads = array('i', (idx[u] for (u, v) in g.edges))
+    tails = array('i', (idx[v] for (u, v) in g.edges))
+    return SparseIncidence(g.nodes, heads, tails)
+
+def sparse_incidence_to_graph(S: SparseIncidence, nodes: List[Any] = None) -> Graph:
+    """Versão esparsa de incidence_matrix_to_graph, em O(n + m)."""
+    if nodes is None:
+        nodes = S.nodes
+    if len(nodes) != S.num_rows:
+        raise ValueError("Tamanho dos vértices não coincide com número de linhas em I")
+    return Graph(nodes, ((nodes[a], nodes[b]) for a, b in zip(S.heads, S.tails)))
+
 # 5) Dado um grafo, gere sua lista (lista de adjacência)
 def graph_to_adj_list(g: Graph) -> Dict[Any, List[Any]]:
     """
     Retorna dicionário: vértice -> lista de vizinhos.
     """
-    adj = {v: [] for v in g.nodes}
-    for (u, v) in g.edges:
-        if u == v:
-            adj[u].append(v)  # loop aparece uma vez (poderíamos adicionar duas vezes se quisermos)
-        else:
-            adj[u].append(v)
-            adj[v].append(u)
-    return adj
+    # o índice de vizinhança já guarda os vizinhos na ordem das arestas
+    # (loop aparece uma vez; poderíamos adicionar duas vezes se quisermos)
+    return {v: g.neighbors(v) for v in g.nodes}
 
 # 6) Dado uma lista (adjacency list), gere o grafo correspondente
 def adj_list_to_graph(adj: Dict[Any, List[Any]]) -> Graph:
     """
     Recebe dicionário vértice -> lista de vizinhos (pode conter ambos u->v e v->u).
     Constrói lista de vértices e normaliza arestas (remove duplicatas).
+    As duplicatas são descartadas pelo próprio Graph ao inserir, comparando ids inteiros
+    (u->v e v->u viram uma única aresta, na orientação em que apareceu primeiro).
     """
-    nodes = list(adj.keys())
-    edges_set = set()
-    for u, neighs in adj.items():
-        for v in neighs:
-            if u == v:
-                edges_set.add((u, v))
-            else:
-                # armazenar em ordem canônica para evitar duplicatas
-                a, b = (u, v) if (str(u), str(v)) <= (str(v), str(u)) else (v, u)
-                edges_set.add((a, b))
-    edges = list(edges_set)
-    return Graph(nodes, edges)
+    return Graph.from_edges(((u, v) for u, neighs in adj.items() for v in neighs), nodes=list(adj.keys()))
 
 # 7) Implementar função que, dada uma descrição em uma das representações, gere as outras duas
 def convert_representation(obj: Any, kind: str) -> Dict[str, Any]:
@@ -189,13 +915,25 @@ def convert_representation(obj: Any, kind: str) -> Dict[str, Any]:
     else:
         raise ValueError("kind inválido")
 
+    # as representações ficam no cache do grafo enquanto ele não for alterado
     result['graph'] = g
-    result['adj_matrix'] = graph_to_adj_matrix(g)
-    result['incidence'] = graph_to_incidence_matrix(g)
-    result['adj_list'] = graph_to_adj_list(g)
+    result['adj_matrix'] = g.cached('adj_matrix', lambda: graph_to_adj_matrix(g))
+    result['incidence'] = g.cached('incidence', lambda: graph_to_incidence_matrix(g))
+    result['adj_list'] = g.cached('adj_list', lambda: graph_to_adj_list(g))
     return result
 
 
+def cached_spring_layout(g: Graph, nx_graph: Any, **kwargs) -> Dict[Any, Any]:
+    """
+    nx.spring_layout(nx_graph, **kwargs) memoizado no cache de g (nx_graph deve ser a conversão de g),
+    para que redesenhar o mesmo grafo não recalcule o layout.
+    """
+    if not isinstance(g, Graph):
+        return nx.spring_layout(nx_graph, **kwargs)
+    key = ('spring_layout',) + tuple(sorted(kwargs.items()))
+    return g.cached(key, lambda: nx.spring_layout(nx_graph, **kwargs))
+
+
 def visualize_graph(g: Graph, title: str = "Grafo"):
     """
     Visualiza o grafo usando networkx. (Apenas visualização; não usa networkx para cálculos)
@@ -216,7 +954,7 @@ def visualize_graph(g: Graph, title: str = "Grafo"):
         Gnx.add_edges_from(g.edges)
     
     # Define o layout
-    pos = nx.spring_layout(Gnx)
+    pos = cached_spring_layout(g, Gnx)
     
     # Desenha o grafo
     nx.draw(Gnx, pos, with_labels=True, node_color='lightblue', 
@@ -243,9 +981,15 @@ def get_nodes_num(g: Graph = None, M = None, I = None, adj = None) -> int:
     if g:
         for u in g.nodes:
             count += 1
+    elif _is_array(M):
+        count = M.shape[0]
     elif M:
         for u in M:
             count += 1
+    elif isinstance(I, SparseIncidence):
+        count = I.num_rows
+    elif _is_array(I):
+        count = I.shape[0]
     elif I:
         for u in I:
             count += 1
@@ -255,6 +999,9 @@ def get_nodes_num(g: Graph = None, M = None, I = None, adj = None) -> int:
 
     return count
 
+# nome usado pelo menu e pelos scripts de análise
+get_vertices_num = get_nodes_num
+
 def get_edge_num(g: Graph = None, M = None, I = None, adj = None) -> int:
     """
     De acordo com g, M, I ou adj for passado como parâmetro trata como a representação respectiva
@@ -264,9 +1011,16 @@ def get_edge_num(g: Graph = None, M = None, I = None, adj = None) -> int:
     retorna o número de arestas
     """
     count = 0
-    if g:
+    if isinstance(g, FrozenGraph):
+        count = g.num_edges
+    elif g:
         for u in g.edges:
             count += 1
+    elif _is_array(M):
+        # cada aresta aparece duas vezes na matriz, exceto loops (contados duas vezes pelo traço)
+        A = (M == 1)
+        count = int(np.count_nonzero(A)) + int(np.trace(A))
+        count /= 2
     elif M:
         l = get_nodes_num(M = M)
         for u in range(l):
@@ -276,6 +1030,10 @@ def get_edge_num(g: Graph = None, M = None, I = None, adj = None) -> int:
                     if u == v:
                         count += 1
         count /= 2
+    elif isinstance(I, SparseIncidence):
+        count = I.num_cols
+    elif _is_array(I):
+        count = I.shape[1]
     elif I:
         for u in I[0]:
             count += 1
@@ -299,7 +1057,12 @@ def get_adj_vertice(vertice: object, g: Graph = None, M = None, I = None, adj =
     e depois retorna a lista que tem os vértices adjacentes
     """
     list = []
-    if g:
+    if isinstance(g, (Graph, FrozenGraph)):
+        list = g.neighbors(vertice)
+        if vertice in list:
+            # o loop aparece uma vez na vizinhança, mas aqui (como no caminho por g.edges) conta duas
+            list.insert(list.index(vertice), vertice)
+    elif g:
         for (u, v) in g.edges:
             if u == vertice and v not in list:
                 list.append(v)
@@ -307,11 +1070,23 @@ def get_adj_vertice(vertice: object, g: Graph = None, M = None, I = None, adj =
                 list.append(u)
             if u == v:
                 list.append(u)
+    elif _is_array(M):
+        list = np.flatnonzero(M[vertice] == 1).tolist()
     elif M:
         len = get_nodes_num(M = M)
         for i in range(len):
             if M[vertice][i] == 1:
                 list.append(i)
+    elif isinstance(I, SparseIncidence):
+        list = I.neighbors(vertice)
+    elif _is_array(I):
+        # só as colunas em que o vertice incide, e em cada uma as outras linhas com 1
+        linha = I[vertice]
+        for i in np.flatnonzero((linha == 1) | (linha == 2)).tolist():
+            if linha[i] == 2:
+                list.append(vertice)
+            else:
+                list.extend(j for j in np.flatnonzero(I[:, i] == 1).tolist() if j != vertice)
     elif I:
         n_vertice = get_nodes_num(I = I)
         n_edge = get_edge_num(I = I)
@@ -336,19 +1111,25 @@ def edge_exist(vertice1: object, vertice2: object, g: Graph = None, M = None, I
     se isso acontece existe a aresta
     """
 
-    if g:
+    if isinstance(g, (Graph, FrozenGraph)):
+        return g.has_edge(vertice1, vertice2)
+
+    elif g:
         if vertice2 in get_adj_vertice(vertice = vertice1, g = g):
             return True
         else:
             return False
 
+    elif _is_array(M):
+        return bool(M[vertice1, vertice2] == 1)
+
     elif M:
         if vertice2 in get_adj_vertice(vertice = vertice1, M = M):
             return True
         else:
             return False
 
-    elif I:
+    elif _is_array(I) or I:
         if vertice2 in get_adj_vertice(vertice = vertice1, I = I):
             return True
         else:
@@ -365,15 +1146,21 @@ def get_degree(vertice: object, g: Graph = None, M = None, I = None, adj = None)
     usa variavel count para contar cada vertice adjacente e retornar esse número para todos os casos
     """
     count = 0
-    if g:
+    if isinstance(g, (Graph, FrozenGraph)):
+        count = g.degree(vertice)
+    elif g:
         adj_list = get_adj_vertice(vertice, g = g)
         for i in adj_list:
             count += 1
+    elif _is_array(M):
+        count = int(np.count_nonzero(M[vertice] == 1))
     elif M:
         adj_list = get_adj_vertice(vertice, M = M)
         for i in adj_list:
             count += 1
-    elif I:
+    elif isinstance(I, SparseIncidence):
+        count = len(I.neighbors(vertice))
+    elif _is_array(I) or I:
         adj_list = get_adj_vertice(vertice, I = I)
         for i in adj_list:
             count += 1
@@ -384,118 +1171,570 @@ def get_degree(vertice: object, g: Graph = None, M = None, I = None, adj = None)
 
     return count
 
-def list_all_degrees(g: Graph = None, M = None, I = None, adj = None) -> dict[object, object]:
+def _degrees_single_pass(g: Graph = None, M = None, I = None, adj = None) -> Tuple[List[object], List[int]]:
+    """
+    Calcula os graus de todos os vértices em uma única passada pela representação:
+    arestas (g), linhas (M), colunas (I) ou listas (adj).
+    Retorna (vértices, graus) na ordem de g.nodes, das linhas de M/I ou das chaves de adj.
+    Os graus seguem as mesmas regras de get_degree para cada representação.
+    """
+    if isinstance(g, (Graph, FrozenGraph)):
+        return g.nodes, [g._degree_idx(i) for i in range(len(g.nodes))]
+    elif g:
+        keys = list(g.nodes)
+        graus = {v: 0 for v in keys}
+        for (u, v) in g.edges:
+            graus[u] = graus.get(u, 0) + 1
+            graus[v] = graus.get(v, 0) + 1
+        return keys, [graus[v] for v in keys]
+    elif _is_array(M):
+        # soma das linhas em uma única operação vetorizada
+        return range(M.shape[0]), (M == 1).sum(axis=1).tolist()
+    elif M:
+        return range(len(M)), [row.count(1) for row in M]
+    elif isinstance(I, SparseIncidence):
+        return range(I.num_rows), I.degrees()
+    elif _is_array(I):
+        # loops (2) contam 1; cada 1 conta as outras linhas com 1 na mesma coluna
+        uns = (I == 1)
+        por_coluna = uns.sum(axis=0)
+        graus = (I == 2).sum(axis=1) + (uns * (por_coluna - 1)).sum(axis=1)
+        return range(I.shape[0]), graus.tolist()
+    elif I:
+        # uma passada pelas células, agrupando por coluna as linhas incidentes
+        n = len(I)
+        graus = [0] * n
+        incidentes = [[] for _ in range(len(I[0]))]
+        for row in range(n):
+            for col, val in enumerate(I[row]):
+                if val == 2:
+                    graus[row] += 1
+                elif val == 1:
+                    incidentes[col].append(row)
+        for linhas in incidentes:
+            for row in linhas:
+                graus[row] += len(linhas) - 1
+        return range(n), graus
+    elif adj:
+        keys = list(adj.keys())
+        return keys, [len(adj[v]) for v in keys]
+    return [], []
+
+def list_all_degrees(g: Graph = None, M = None, I = None, adj = None, as_array: bool = False):
     """
     De acordo com g, M, I ou adj for passado como parâmetro trata como a representação respectiva
-    para todos os nodes calcula seu grau e adiciona no dicionario que é retornado posteriormente
+    calcula o grau de todos os nodes em uma única passada (ver _degrees_single_pass)
+    e retorna um dicionário vértice -> grau, ou, se as_array for True, um array 'l' compacto
+    com os graus na ordem dos vértices (g.nodes, linhas de M/I ou chaves de adj)
     """
-    all_degrees = {}
+    if isinstance(g, Graph):
+        # os graus ficam no cache do grafo
+        graus = g.cached('degrees', lambda: array('l', _degrees_single_pass(g = g)[1]))
+        keys = g.nodes
+    else:
+        keys, graus = _degrees_single_pass(g = g, M = M, I = I, adj = adj)
+    if as_array:
+        return array('l', graus)
+    return dict(zip(keys, graus))
 
+def degree_sequence(g: Graph = None, M = None, I = None, adj = None) -> List[int]:
+    """
+    Retorna a sequência de graus (em ordem não-crescente) da representação passada,
+    calculada em uma única passada.
+    """
+    return sorted(list_all_degrees(g = g, M = M, I = I, adj = adj, as_array = True), reverse=True)
+
+def _vizinhanca(g: Graph = None, M = None, I = None, adj = None):
+    """
+    Retorna uma função vertice -> lista de vizinhos para a representação passada, usada pelos
+    algoritmos de busca. Uma matriz de incidência densa é convertida uma única vez para
+    SparseIncidence, para que cada consulta não percorra a matriz inteira.
+    """
     if g:
-        for i in g.nodes:
-            all_degrees[i] = get_degree(vertice = i, g = g)
-    elif M:
-        for i in range(get_nodes_num(M = M)):
-            all_degrees[i] = get_degree(vertice = i, M = M)
-    elif I:
-        for i in range(get_nodes_num(I = I)):
-            all_degrees[i] = get_degree(vertice = i, I = I)
+        if isinstance(g, (Graph, FrozenGraph)):
+            return g.neighbors
+        return lambda v: get_adj_vertice(vertice = v, g = g)
+    elif M is not None:
+        return lambda v: get_adj_vertice(vertice = v, M = M)
+    elif _is_array(I) or I:
+        S = I if isinstance(I, SparseIncidence) else SparseIncidence.from_dense(I)
+        return S.neighbors
     elif adj:
-        for i in list(adj.keys()):
-            all_degrees[i] = get_degree(vertice = i, adj = adj)
+        return lambda v: adj[v]
+    raise ValueError("Nenhuma representação de grafo foi passada")
 
-    return all_degrees
+def caminho_mais_curto(vertice1: object, vertice2: object, g: Graph = None, M = None, I = None, adj = None) -> list[object]:
+    """
+    De acordo com g, M, I ou adj for passado como parâmetro trata como a representação respectiva
+    faz uma busca em largura (BFS) iterativa a partir de vertice1 guardando o pai de cada vértice
+    retorna o caminho com o menor número de arestas até vertice2, ou None se não existir
+    Complexity: O(n + m)
+    """
+    if vertice1 == vertice2:
+        return [vertice1]
+    vizinhos = _vizinhanca(g = g, M = M, I = I, adj = adj)
+    pai = {vertice1: None}
+    fila = deque([vertice1])
+    while fila:
+        u = fila.popleft()
+        for w in vizinhos(u):
+            if w not in pai:
+                pai[w] = u
+                if w == vertice2:
+                    return _reconstruir_caminho(pai, vertice2)
+                fila.append(w)
+    return None
 
-def caminho_simples(caminho: list[object], vertice1: object, vertice2: object, g: Graph = None, M = None, I = None, adj = None) -> list[object]:
+def _reconstruir_caminho(pai: dict, fim: object) -> list[object]:
+    """Segue os pais a partir de fim até a origem (pai None) e retorna o caminho na ordem origem -> fim."""
+    caminho = [fim]
+    while pai[fim] is not None:
+        fim = pai[fim]
+        caminho.append(fim)
+    caminho.reverse()
+    return caminho
+
+def caminho_bidirecional(vertice1: object, vertice2: object, g: Graph = None, M = None, I = None, adj = None) -> list[object]:
     """
     De acordo com g, M, I ou adj for passado como parâmetro trata como a representação respectiva
-    para todos os casos vai colocando no caminho os nodes visitados a partir dos nodes adjacentes
-    vai percorrendo recursivamente, se achar um resultado ele é propagado até a primeira chamada da recursão
-    caso contrario é retirado o ultimo elemento do caminho e retorna None
+    faz duas BFS simultâneas, uma a partir de cada extremidade, expandindo sempre a fronteira menor,
+    até que elas se encontrem; retorna um caminho com o menor número de arestas ou None
+    Em grafos grandes visita bem menos vértices que caminho_mais_curto para consultas ponto a ponto
     """
-    resultado = None
-    caminho.append(vertice1)
     if vertice1 == vertice2:
-        return caminho.copy()
-    
-    if g:
-        v_adj = get_adj_vertice(vertice = vertice1, g = g)
-    elif M:
-        v_adj = get_adj_vertice(vertice = vertice1, M = M)
-    elif I:
-        v_adj = get_adj_vertice(vertice = vertice1, I = I)
-    elif adj:
-        v_adj = get_adj_vertice(vertice = vertice1, adj = adj)
-
-    for i in v_adj:
-        if i not in caminho:
-
-            if g:
-                resultado = caminho_simples(caminho = caminho, vertice1 = i, vertice2 = vertice2, g = g)
-            elif M:
-                resultado = caminho_simples(caminho = caminho, vertice1 = i, vertice2 = vertice2, M = M)
-            elif I:
-                resultado = caminho_simples(caminho = caminho, vertice1 = i, vertice2 = vertice2, I = I)
-            elif adj:
-                resultado = caminho_simples(caminho = caminho, vertice1 = i, vertice2 = vertice2, adj = adj)
-
-            if resultado != None:
-                return resultado
-    caminho.pop()
+        return [vertice1]
+    vizinhos = _vizinhanca(g = g, M = M, I = I, adj = adj)
+    pai_ida, pai_volta = {vertice1: None}, {vertice2: None}
+    fronteira_ida, fronteira_volta = [vertice1], [vertice2]
+    while fronteira_ida and fronteira_volta:
+        # expande um nível inteiro da fronteira menor
+        if len(fronteira_ida) > len(fronteira_volta):
+            fronteira_ida, fronteira_volta = fronteira_volta, fronteira_ida
+            pai_ida, pai_volta = pai_volta, pai_ida
+        proxima = []
+        encontro = None
+        for u in fronteira_ida:
+            for w in vizinhos(u):
+                if w not in pai_ida:
+                    pai_ida[w] = u
+                    if w in pai_volta:
+                        encontro = w
+                        break
+                    proxima.append(w)
+            if encontro is not None:
+                break
+        if encontro is not None:
+            lado_a = _reconstruir_caminho(pai_ida, encontro)
+            lado_b = _reconstruir_caminho(pai_volta, encontro)
+            caminho = lado_a + lado_b[-2::-1]
+            if caminho[0] != vertice1:
+                caminho.reverse()
+            return caminho
+        fronteira_ida = proxima
+    return None
+
+def caminho_dfs(vertice1: object, vertice2: object, g: Graph = None, M = None, I = None, adj = None, evitar: Iterable[object] = ()) -> list[object]:
+    """
+    De acordo com g, M, I ou adj for passado como parâmetro trata como a representação respectiva
+    busca em profundidade com pilha explícita (sem recursão, logo sem limite de profundidade)
+    retorna o primeiro caminho simples encontrado de vertice1 até vertice2, explorando os vizinhos
+    na mesma ordem da versão recursiva, sem visitar os vértices em evitar (vertice1 não é testado); ou None
+    """
+    if vertice1 == vertice2:
+        return [vertice1]
+    vizinhos = _vizinhanca(g = g, M = M, I = I, adj = adj)
+    bloqueados = set(evitar)
+    caminho = [vertice1]
+    no_caminho = {vertice1}
+    pilha = [iter(vizinhos(vertice1))]
+    while pilha:
+        avancou = False
+        for w in pilha[-1]:
+            if w not in no_caminho and w not in bloqueados:
+                caminho.append(w)
+                if w == vertice2:
+                    return caminho
+                no_caminho.add(w)
+                pilha.append(iter(vizinhos(w)))
+                avancou = True
+                break
+        if not avancou:
+            pilha.pop()
+            no_caminho.discard(caminho.pop())
+    return None
+
+def caminho_simples(caminho: list[object], vertice1: object, vertice2: object, g: Graph = None, M = None, I = None, adj = None) -> list[object]:
+    """
+    De acordo com g, M, I ou adj for passado como parâmetro trata como a representação respectiva
+    procura um caminho simples de vertice1 até vertice2 que não passe pelos vértices já em caminho
+    (busca em profundidade iterativa, ver caminho_dfs); se achar, estende caminho com ele e retorna
+    uma cópia de caminho, caso contrario caminho fica inalterado e retorna None
+    """
+    resultado = caminho_dfs(vertice1, vertice2, g = g, M = M, I = I, adj = adj, evitar = caminho)
+    if resultado is None:
+        return None
+    caminho.extend(resultado)
+    return caminho.copy()
+
+def caminhos_simples(vertice1: object, vertice2: object, g: Graph = None, M = None, I = None, adj = None, max_length: int = None, podar: bool = True):
+    """
+    De acordo com g, M, I ou adj for passado como parâmetro trata como a representação respectiva
+    gerador que produz, sob demanda, todos os caminhos simples de vertice1 até vertice2 com no máximo
+    max_length arestas (sem limite se None), na ordem da busca em profundidade
+    Usa pilha explícita e um bytearray de visitados indexado por id, sem copiar o caminho a cada passo.
+    Com podar=True calcula antes a distância BFS de cada vértice até vertice2 e não entra em ramos que
+    não alcançam vertice2 ou que não conseguem chegar nele dentro do limite restante.
+    """
+    rotulos, vizinhos = _adjacencia_ids(g = g, M = M, I = I, adj = adj)
+    ids = g.labels.ids if isinstance(g, Graph) else {v: i for i, v in enumerate(rotulos)}
+    if vertice1 not in ids or vertice2 not in ids:
+        return
+    origem, destino = ids[vertice1], ids[vertice2]
+    if origem == destino:
+        yield [vertice1]
+        return
+    limite = max_length if max_length is not None else len(rotulos) - 1
+    if limite < 1:
+        return
+    if podar:
+        dist = {destino: 0}
+        fila = deque([destino])
+        while fila:
+            u = fila.popleft()
+            if dist[u] >= limite:
+                break
+            for w in vizinhos[u]:
+                if w not in dist:
+                    dist[w] = dist[u] + 1
+                    fila.append(w)
+        if origem not in dist:
+            return
+    visitado = bytearray(len(rotulos))
+    visitado[origem] = 1
+    caminho = [origem]
+    pilha = [iter(vizinhos[origem])]
+    while pilha:
+        for w in pilha[-1]:
+            if visitado[w]:
+                continue
+            tamanho = len(caminho)  # arestas do caminho depois de incluir w
+            if w == destino:
+                yield [rotulos[i] for i in caminho] + [vertice2]
+                continue
+            if tamanho >= limite or (podar and tamanho + dist.get(w, limite) > limite):
+                continue
+            caminho.append(w)
+            visitado[w] = 1
+            pilha.append(iter(vizinhos[w]))
+            break
+        else:
+            pilha.pop()
+            visitado[caminho.pop()] = 0
+
+def _aresta_paralela(vertice: object, vizinhos) -> object:
+    """Primeiro vizinho que aparece repetido na lista de vizinhos de vertice (aresta paralela), ou None. Loops não contam."""
+    vistos = set()
+    for w in vizinhos(vertice):
+        if w != vertice:
+            if w in vistos:
+                return w
+            vistos.add(w)
     return None
 
+def _ciclo_mais_curto_bfs(vertice: object, vizinhos, limite: int = None) -> list[object]:
+    """
+    BFS a partir de vertice marcando por qual vizinho de vertice (ramo) cada vértice foi alcançado.
+    Uma aresta fora da árvore entre ramos diferentes fecha um ciclo que passa por vertice, de
+    tamanho dist(x) + dist(y) + 1; retorna o menor deles como [vertice, ..., x, y, ..., vertice],
+    ou None. Loops são ignorados. Se limite for dado, só procura ciclos com menos de limite arestas.
+    Arestas paralelas (vizinho repetido, em M/I/adj) entre vertice e w formam o ciclo [vertice, w, vertice],
+    de 2 arestas, que é o menor possível.
+    Complexity: O(n + m)
+    """
+    w = _aresta_paralela(vertice, vizinhos)
+    if w is not None and (limite is None or 2 < limite):
+        return [vertice, w, vertice]
+    pai = {vertice: None}
+    dist = {vertice: 0}
+    ramo = {vertice: None}
+    melhor, melhor_par = limite, None
+    fila = deque([vertice])
+    while fila:
+        u = fila.popleft()
+        # qualquer ciclo ainda não visto terá pelo menos 2 * dist(u) + 1 arestas
+        if melhor is not None and 2 * dist[u] + 1 >= melhor:
+            break
+        for w in vizinhos(u):
+            if w == u or w == pai[u]:
+                continue
+            if w not in dist:
+                pai[w] = u
+                dist[w] = dist[u] + 1
+                ramo[w] = w if u == vertice else ramo[u]
+                fila.append(w)
+            elif u != vertice and w != vertice and ramo[w] != ramo[u]:
+                tamanho = dist[u] + dist[w] + 1
+                if melhor is None or tamanho < melhor:
+                    melhor, melhor_par = tamanho, (u, w)
+    if melhor_par is None:
+        return None
+    x, y = melhor_par
+    # percorre o ciclo começando pelo ramo descoberto primeiro
+    cabecas = list(vizinhos(vertice))
+    if cabecas.index(ramo[x]) > cabecas.index(ramo[y]):
+        x, y = y, x
+    return _reconstruir_caminho(pai, x) + _reconstruir_caminho(pai, y)[::-1]
+
 def ciclo_vertice(vertice: object, g: Graph = None, M = None, I = None, adj = None):
     """
     De acordo com g, M, I ou adj for passado como parâmetro trata como a representação respectiva
-    para todos os casos pega os nodes adjacentes do primeiro vertice
-    para cada um deles tenta pegar um terceiro vertice distinto dos que ja estao sendo considerados
-    ao ter 3 nodes distintos tenta achar um caminho entre o terceiro vertice e o primeiro
-    se achar algum caminho este sera um ciclo
+    faz uma busca em largura a partir do vertice (ver _ciclo_mais_curto_bfs) e retorna o menor
+    ciclo que passa pelo vertice, no formato [vertice, ..., vertice], ou None se o vertice não
+    estiver em nenhum ciclo; arestas paralelas formam um ciclo de 2 arestas e loops são ignorados
+    Complexity: O(n + m)
+
+    Examples:
+        >>> ciclo_vertice(0, adj = {0: [1, 2], 1: [0, 2], 2: [0, 1]})
+        [0, 1, 2, 0]
+        >>> ciclo_vertice(0, adj = {0: [1, 1], 1: [0, 0]})
+        [0, 1, 0]
+        >>> ciclo_vertice(0, I = [[1, 1], [1, 1]])
+        [0, 1, 0]
+        >>> ciclo_vertice(0, adj = {0: [1], 1: [0]}) is None
+        True
     """
+    return _ciclo_mais_curto_bfs(vertice, _vizinhanca(g = g, M = M, I = I, adj = adj))
 
+def _vertices_de(g: Graph = None, M = None, I = None, adj = None) -> Iterable[object]:
+    """Vértices da representação: g.nodes, índices das linhas de M/I ou chaves de adj."""
     if g:
-        v1_adj = get_adj_vertice(vertice = vertice, g = g)
-    elif M:
-        v1_adj = get_adj_vertice(vertice = vertice, M = M)
-    elif I:
-        v1_adj = get_adj_vertice(vertice = vertice, I = I)
+        return g.nodes
+    elif M is not None:
+        return range(get_nodes_num(M = M))
+    elif _is_array(I) or I:
+        return range(I.num_rows if isinstance(I, SparseIncidence) else len(I))
     elif adj:
-        v1_adj = get_adj_vertice(vertice = vertice, adj = adj)
-
-    for i in v1_adj:
-
-        if g:
-            v2_adj = get_adj_vertice(vertice = i, g = g)
-        elif M:
-            v2_adj = get_adj_vertice(vertice = i, M = M)
-        elif I:
-            v2_adj = get_adj_vertice(vertice = i, I = I)
-        elif adj:
-            v2_adj = get_adj_vertice(vertice = i, adj = adj)
-
-        if vertice in v2_adj:
-            v2_adj.remove(vertice)
-        if i in v2_adj:
-            v2_adj.remove(i)
-
-        for j in v2_adj:
-            cam = []
-            cam.append(i)
-
-            if g:
-                ciclo = caminho_simples(caminho = cam, vertice1 = j, vertice2 = vertice, g = g)
-            elif M:
-                ciclo = caminho_simples(caminho = cam, vertice1 = j, vertice2 = vertice, M = M)
-            elif I:
-                ciclo = caminho_simples(caminho = cam, vertice1 = j, vertice2 = vertice, I = I)
-            elif adj:
-                ciclo = caminho_simples(caminho = cam, vertice1 = j, vertice2 = vertice, adj = adj)
-
-            if ciclo != None:
-                ciclo.insert(0, vertice)
-                return ciclo
+        return adj.keys()
+    return []
+
+def encontrar_ciclo(g: Graph = None, M = None, I = None, adj = None) -> list[object]:
+    """
+    De acordo com g, M, I ou adj for passado como parâmetro trata como a representação respectiva
+    busca em profundidade iterativa guardando o pai de cada vértice, em todas as componentes;
+    a primeira aresta que leva a um vértice já visitado (que não seja o pai) fecha um ciclo
+    retorna esse ciclo no formato [v, ..., v], ou None se o grafo for acíclico (floresta)
+    Loops são ignorados; só a primeira ocorrência do pai é a aresta da árvore, então uma aresta
+    paralela ao pai fecha o ciclo [pai, v, pai]. Complexity: O(n + m)
+
+    Examples:
+        >>> encontrar_ciclo(adj = {0: [1, 1], 1: [0, 0]})
+        [0, 1, 0]
+    """
+    vizinhos = _vizinhanca(g = g, M = M, I = I, adj = adj)
+    pai = {}
+    for raiz in _vertices_de(g = g, M = M, I = I, adj = adj):
+        if raiz in pai:
+            continue
+        pai[raiz] = None
+        na_pilha = {raiz}
+        pilha = [[raiz, iter(vizinhos(raiz)), False]]  # [vértice, vizinhos restantes, aresta do pai já vista]
+        while pilha:
+            topo = pilha[-1]
+            u, it = topo[0], topo[1]
+            for w in it:
+                if w == u:
+                    continue
+                if w == pai[u] and not topo[2]:
+                    topo[2] = True
+                    continue
+                if w in na_pilha:
+                    # aresta de retorno: o ciclo é w -> ... -> u -> w
+                    ciclo = [u]
+                    while ciclo[-1] != w:
+                        ciclo.append(pai[ciclo[-1]])
+                    ciclo.reverse()
+                    return ciclo + [w]
+                if w not in pai:
+                    pai[w] = u
+                    na_pilha.add(w)
+                    pilha.append([w, iter(vizinhos(w)), False])
+                    break
+            else:
+                pilha.pop()
+                na_pilha.discard(u)
     return None
-    
+
+def cintura(g: Graph = None, M = None, I = None, adj = None) -> Tuple[int, list[object]]:
+    """
+    De acordo com g, M, I ou adj for passado como parâmetro trata como a representação respectiva
+    calcula a cintura (girth) do grafo: o tamanho do menor ciclo, usando uma BFS a partir de cada
+    vértice limitada pelo menor ciclo já encontrado
+    retorna (tamanho, ciclo) ou (None, None) se o grafo for acíclico
+    arestas paralelas dão cintura 2 (ciclo [v, w, v]); loops são ignorados
+    Complexity: O(n * (n + m)) no pior caso
+
+    Examples:
+        >>> cintura(adj = {0: [1, 1], 1: [0, 0]})
+        (2, [0, 1, 0])
+    """
+    vizinhos = _vizinhanca(g = g, M = M, I = I, adj = adj)
+    for v in _vertices_de(g = g, M = M, I = I, adj = adj):
+        w = _aresta_paralela(v, vizinhos)
+        if w is not None:
+            return 2, [v, w, v]
+    melhor = None
+    for v in _vertices_de(g = g, M = M, I = I, adj = adj):
+        ciclo = _ciclo_mais_curto_bfs(v, vizinhos, limite = len(melhor) - 1 if melhor else None)
+        if ciclo is not None:
+            melhor = ciclo
+            if len(melhor) - 1 == 3:  # nenhum ciclo simples é menor que um triângulo
+                break
+    if melhor is None:
+        return None, None
+    return len(melhor) - 1, melhor
+
+def _adjacencia_ids(g: Graph = None, M = None, I = None, adj = None) -> Tuple[List[object], List[List[int]]]:
+    """
+    Converte a representação para (rótulos, vizinhos) com vértices como ids densos 0..n-1:
+    vizinhos[i] é a lista sem repetições dos ids adjacentes a i, sem loops.
+    Para main.Graph reaproveita o índice _adj, que já está em ids.
+    """
+    if isinstance(g, Graph):
+        return g.nodes, [[j for j in vizinhos_i if j != i] for i, vizinhos_i in enumerate(g._adj)]
+    rotulos = list(_vertices_de(g = g, M = M, I = I, adj = adj))
+    ids = {v: i for i, v in enumerate(rotulos)}
+    vizinhos = _vizinhanca(g = g, M = M, I = I, adj = adj)
+    lista = []
+    for i, v in enumerate(rotulos):
+        lista.append([j for j in dict.fromkeys(ids[w] for w in vizinhos(v)) if j != i])
+    return rotulos, lista
+
+def ciclos_simples(g: Graph = None, M = None, I = None, adj = None, max_length: int = None, max_count: int = None, stats: Dict[str, Any] = None):
+    """
+    De acordo com g, M, I ou adj for passado como parâmetro trata como a representação respectiva
+    gerador que produz, sob demanda, cada ciclo simples do grafo (com pelo menos 3 arestas) uma
+    única vez, no formato [v, ..., v]. O ciclo começa pelo seu vértice de menor id e é percorrido no
+    sentido em que o segundo vértice tem id menor que o penúltimo.
+    - max_length: só gera ciclos com no máximo max_length arestas
+    - max_count: para depois de gerar max_count ciclos
+    - stats: se for um dict, é preenchido com 'ciclos', 'passos' (vértices empilhados), 'tempo' (s)
+      e 'ciclos_por_segundo', atualizados a cada ciclo gerado e ao terminar
+    Sem max_length usa o algoritmo de Johnson (bloqueio de vértices), O((n + m)(c + 1)) para c ciclos;
+    com max_length o bloqueio deixa de ser válido e é feita uma DFS limitada, podada pela distância
+    de cada vértice até o vértice inicial. Memória O(n + m) em ambos os casos.
+    """
+    rotulos, vizinhos = _adjacencia_ids(g = g, M = M, I = I, adj = adj)
+    n = len(rotulos)
+    if stats is None:
+        stats = {}
+    stats.update(ciclos = 0, passos = 0, tempo = 0.0, ciclos_por_segundo = 0.0)
+    inicio = time.perf_counter()
+
+    def atualizar():
+        stats['tempo'] = time.perf_counter() - inicio
+        stats['ciclos_por_segundo'] = stats['ciclos'] / stats['tempo'] if stats['tempo'] > 0 else 0.0
+
+    try:
+        if max_count is not None and max_count <= 0:
+            return
+        for s in range(n):
+            if max_length is None:
+                busca = _ciclos_johnson(s, vizinhos, stats)
+            else:
+                busca = _ciclos_limitados(s, vizinhos, max_length, stats)
+            for caminho in busca:
+                stats['ciclos'] += 1
+                atualizar()
+                yield [rotulos[i] for i in caminho] + [rotulos[s]]
+                if max_count is not None and stats['ciclos'] >= max_count:
+                    return
+    finally:
+        atualizar()
+
+def _ciclos_johnson(s: int, vizinhos: List[List[int]], stats: Dict[str, Any]):
+    """
+    Circuitos de Johnson a partir de s no subgrafo dos ids >= s, com pilha explícita.
+    O grafo não-direcionado é tratado como direcionado simétrico; os circuitos de 2 vértices e a
+    segunda orientação de cada ciclo são descartados. Gera o caminho (lista de ids) de cada ciclo.
+    """
+    bloqueado = bytearray(len(vizinhos))
+    B = {}
+
+    def desbloquear(v):
+        pendentes = [v]
+        while pendentes:
+            u = pendentes.pop()
+            if bloqueado[u]:
+                bloqueado[u] = 0
+                pendentes.extend(B.pop(u, ()))
+
+    caminho = [s]
+    fechou = [False]
+    bloqueado[s] = 1
+    pilha = [iter(vizinhos[s])]
+    while pilha:
+        for w in pilha[-1]:
+            if w < s:
+                continue
+            if w == s:
+                fechou[-1] = True
+                if len(caminho) >= 3 and caminho[1] < caminho[-1]:
+                    yield caminho
+            elif not bloqueado[w]:
+                caminho.append(w)
+                fechou.append(False)
+                bloqueado[w] = 1
+                pilha.append(iter(vizinhos[w]))
+                stats['passos'] += 1
+                break
+        else:
+            pilha.pop()
+            v = caminho.pop()
+            if fechou.pop():
+                desbloquear(v)
+                if fechou:
+                    fechou[-1] = True
+            else:
+                for w in vizinhos[v]:
+                    if w >= s:
+                        B.setdefault(w, set()).add(v)
+
+def _ciclos_limitados(s: int, vizinhos: List[List[int]], max_length: int, stats: Dict[str, Any]):
+    """
+    DFS com pilha explícita a partir de s no subgrafo dos ids >= s, gerando os ciclos com no máximo
+    max_length arestas; um vértice w só é empilhado se ainda for possível voltar a s a tempo
+    (arestas no caminho + distância BFS de w até s <= max_length).
+    """
+    dist = {s: 0}
+    fila = deque([s])
+    while fila:
+        u = fila.popleft()
+        # um vértice a distância d de s só está em ciclos com pelo menos 2d arestas
+        if 2 * (dist[u] + 1) > max_length:
+            break
+        for w in vizinhos[u]:
+            if w > s and w not in dist:
+                dist[w] = dist[u] + 1
+                fila.append(w)
+    no_caminho = bytearray(len(vizinhos))
+    no_caminho[s] = 1
+    caminho = [s]
+    pilha = [iter(vizinhos[s])]
+    while pilha:
+        for w in pilha[-1]:
+            if w == s:
+                if len(caminho) >= 3 and caminho[1] < caminho[-1]:
+                    yield caminho
+            elif w > s and not no_caminho[w] and len(caminho) + dist.get(w, max_length) <= max_length:
+                caminho.append(w)
+                no_caminho[w] = 1
+                pilha.append(iter(vizinhos[w]))
+                stats['passos'] += 1
+                break
+        else:
+            pilha.pop()
+            no_caminho[caminho.pop()] = 0
+
 def is_subgraph_21(g1: Graph = None, g2: Graph = None, M1 = None, M2 = None, I1 = None, I2 = None, adj1 = None, adj2 = None, v_list: List = None, v_list2: List = None) -> bool:
     """
     De acordo com g, M, I ou adj for passado como parâmetro trata como a representação respectiva
@@ -505,14 +1744,23 @@ def is_subgraph_21(g1: Graph = None, g2: Graph = None, M1 = None, M2 = None, I1
     """
     if g1 and g2:
         for i in g2.nodes:
-            if i not in g1.nodes:
+            if not g1.has_node(i):
                 return False
         for j in g2.edges:
             u, v = j
-            if j not in g1.edges or u not in g2.nodes or v not in g2.nodes:
+            if not g1.has_edge(u, v) or not g2.has_node(u) or not g2.has_node(v):
                 return False
         return True
-    elif M1 and M2:
+    elif _is_array(M1) or _is_array(M2):
+        # basta um dos lados ser ndarray: o outro (lista de listas) é convertido
+        M1, M2 = np.asarray(M1), np.asarray(M2)
+        pos = {v: i for i, v in enumerate(v_list)}
+        if any(v not in pos for v in v_list2):
+            return False
+        # submatriz de M1 restrita aos vértices de M2 (fancy indexing) comparada de uma vez
+        idx = np.array([pos[v] for v in v_list2], dtype=np.int64)
+        return bool(np.array_equal(M1[np.ix_(idx, idx)], M2))
+    elif M1 is not None and M2 is not None:
         for i in v_list2:
             if i not in v_list:
                 return False
@@ -523,7 +1771,7 @@ def is_subgraph_21(g1: Graph = None, g2: Graph = None, M1 = None, M2 = None, I1
                 if M1[v_list.index(v_list2[i])][v_list.index(v_list2[j])] != value:
                     return False
         return True
-    elif I1 and I2:
+    elif I1 is not None and I2 is not None:
         for i in v_list2:
             if i not in v_list:
                 print("teste1")
@@ -566,7 +1814,7 @@ def is_subgraph(g1: Graph = None, g2: Graph = None, M1 = None, M2 = None, I1 = N
         else:
             return 0
 
-    elif M1 and M2:
+    elif M1 is not None and M2 is not None:
         if is_subgraph_21(M1 = M1, M2 = M2, v_list = v_list, v_list2 = v_list2):
             return 2
         elif is_subgraph_21(M1 = M2, M2 = M1, v_list = v_list2, v_list2 = v_list):
@@ -574,7 +1822,7 @@ def is_subgraph(g1: Graph = None, g2: Graph = None, M1 = None, M2 = None, I1 = N
         else:
             return 0
 
-    elif I1 and I2:
+    elif I1 is not None and I2 is not None:
         if is_subgraph_21(I1 = I1, I2 = I2, v_list = v_list, v_list2 = v_list2):
             return 2
         elif is_subgraph_21(I1 = I2, I2 = I1, v_list = v_list2, v_list2 = v_list):
@@ -655,6 +1903,7 @@ if __name__ == "__main__":
     print("\n=== Procurando ciclos ===")
     print("Ciclo partindo da Sala em G1:", ciclo_vertice('Sala', g=g1))
     print("Ciclo partindo da Sala em G2:", ciclo_vertice('Sala', g=g2))
+    print("Todos os ciclos simples de G1:", list(ciclos_simples(g=g1)))
 
     print("\n=== Verificação de subgrafo ===")
     print("0 = não, 1 = G1 é subgrafo de G2, 2 = G2 é subgrafo de G1")
@@ -1,78 +1,203 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, TextIO, Tuple
+import io
+import sys
 
-def format_matrix(matrix: List[List[int]], vertices: List[str], matrix_type: str = "adjacency") -> str:
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: só é usado quando a matriz já é um ndarray
+    np = None
+
+# acima disso o menu mostra o resumo e só a primeira janela da matriz
+LIMITE_EXIBICAO = 40
+
+def _janela(total: int, janela: Tuple[int, int] = None) -> range:
+    """Intervalo [inicio, fim) de linhas/colunas a exibir, limitado ao tamanho total."""
+    if janela is None:
+        return range(total)
+    inicio, fim = janela
+    return range(max(0, inicio), min(total, fim))
+
+class MatrizGrafo:
     """
-    Formata uma matriz (adjacência ou incidência) para exibição com rótulos.
+    Matriz de adjacência ou de incidência de um Graph, somente leitura, calculada célula a célula:
+    nada da forma densa (V x V ou V x E) é montado. Serve para write_matrix (que só lê as células da
+    janela exibida) e para write_matrix_summary (que usa os graus, sem percorrer as células).
+    Os valores coincidem com graph_to_adj_matrix / graph_to_incidence_matrix.
     """
-    if not matrix or not vertices:
-        return "Matriz vazia"
-    
+    def __init__(self, g: Any, matrix_type: str = "adjacency"):
+        self.g = g
+        self.matrix_type = matrix_type
+
+    def __len__(self) -> int:
+        return len(self.g.nodes)
+
+    def __getitem__(self, i: int) -> '_LinhaMatriz':
+        g = self.g
+        v = g.nodes[i]
+        if self.matrix_type == "adjacency":
+            ids = g.labels.ids
+            vizinhos = {ids[w] for w in g.neighbors(v)}
+            return _LinhaMatriz(len(g.nodes), lambda j: 1 if j in vizinhos else 0)
+        edges = g.edges
+        def celula(e):
+            a, b = edges[e]
+            if a == b:
+                return 2 if a == v else 0
+            return 1 if v == a or v == b else 0
+        return _LinhaMatriz(len(edges), celula)
+
+    def resumo(self) -> Tuple[List[int], int]:
+        """(soma de cada linha, células não nulas), calculados pelos vizinhos de cada vértice em O(n + m)."""
+        g = self.g
+        somas = []
+        nao_nulos = 0
+        for v in g.nodes:
+            vizinhos = g.neighbors(v)
+            nao_nulos += len(vizinhos)
+            # loop: 1 na diagonal da adjacência, 2 na coluna da incidência
+            laco = self.matrix_type != "adjacency" and v in vizinhos
+            somas.append(len(vizinhos) + (1 if laco else 0))
+        return somas, nao_nulos
+
+class _LinhaMatriz:
+    """Linha de MatrizGrafo: cada célula é calculada ao ser lida."""
+    def __init__(self, tamanho: int, celula):
+        self.tamanho = tamanho
+        self.celula = celula
+
+    def __len__(self) -> int:
+        return self.tamanho
+
+    def __getitem__(self, j: int) -> int:
+        return self.celula(j)
+
+def write_matrix(matrix: Any, vertices: List[str], out: TextIO = None, matrix_type: str = "adjacency",
+                 linhas: Tuple[int, int] = None, colunas: Tuple[int, int] = None) -> None:
+    """
+    Escreve a matriz (adjacência ou incidência; lista de listas ou ndarray) em out, uma linha por
+    vez, sem montar o texto inteiro na memória. out é qualquer objeto com write (padrão: sys.stdout).
+    linhas e colunas são janelas (inicio, fim) opcionais para paginar matrizes grandes; as larguras
+    das colunas são calculadas só sobre a janela exibida.
+    """
+    out = out if out is not None else sys.stdout
+    if len(matrix) == 0 or not vertices:
+        out.write("Matriz vazia")
+        return
+    n_cols = len(matrix[0])
+    rows = _janela(len(matrix), linhas)
+    cols = _janela(n_cols, colunas)
+
     # Determina a largura máxima necessária para cada coluna
-    max_vertex_width = max(len(str(v)) for v in vertices)
-    max_value_width = max(len(str(val)) for row in matrix for val in row)
-    col_width = max(max_vertex_width, max_value_width) + 1
-    
-    # Cria o cabeçalho
-    result = " " * (max_vertex_width + 2)  # Espaço para alinhar com a primeira coluna
+    max_vertex_width = max((len(str(vertices[i])) for i in rows), default=0)
+    if np is not None and isinstance(matrix, np.ndarray):
+        bloco = matrix[rows.start:rows.stop, cols.start:cols.stop]
+        max_value_width = len(str(bloco.max())) if bloco.size else 1
+    else:
+        # cada linha é lida uma vez (em MatrizGrafo, montar a linha custa o grau do vértice)
+        max_value_width = max((len(str(row[j])) for row in (matrix[i] for i in rows) for j in cols), default=1)
     if matrix_type == "adjacency":
-        # Para matriz de adjacência, usa os vértices como cabeçalho das colunas
-        for v in vertices:
-            result += str(v).center(col_width)
+        max_vertex_width_cols = max((len(str(vertices[j])) for j in cols), default=0)
     else:
-        # Para matriz de incidência, numera as arestas
-        for i in range(len(matrix[0])):
-            result += f"e{i+1}".center(col_width)
-    result += "\n"
-    
-    # Adiciona uma linha separadora
-    result += "-" * (max_vertex_width + 2 + col_width * len(matrix[0])) + "\n"
-    
-    # Adiciona cada linha da matriz com seu rótulo
-    for v, row in zip(vertices, matrix):
-        result += f"{str(v):>{max_vertex_width}} |"
-        for val in row:
-            result += str(val).center(col_width)
-        result += "\n"
-    
-    return result
+        max_vertex_width_cols = 0
+    col_width = max(max_vertex_width, max_vertex_width_cols, max_value_width) + 1
+
+    # Cabeçalho: vértices (adjacência) ou arestas numeradas (incidência)
+    if matrix_type == "adjacency":
+        cabecalho = "".join(str(vertices[j]).center(col_width) for j in cols)
+    else:
+        cabecalho = "".join(f"e{j+1}".center(col_width) for j in cols)
+    out.write(" " * (max_vertex_width + 2) + cabecalho + "\n")
+    out.write("-" * (max_vertex_width + 2 + col_width * len(cols)) + "\n")
+
+    # Cada linha da matriz com seu rótulo
+    for i in rows:
+        row = matrix[i]
+        valores = "".join(str(row[j]).center(col_width) for j in cols)
+        out.write(f"{str(vertices[i]):>{max_vertex_width}} |{valores}\n")
+
+    if len(rows) < len(matrix) or len(cols) < n_cols:
+        out.write(f"... exibindo linhas {rows.start + 1}-{rows.stop} de {len(matrix)}, "
+                  f"colunas {cols.start + 1}-{cols.stop} de {n_cols}\n")
+
+def format_matrix(matrix: List[List[int]], vertices: List[str], matrix_type: str = "adjacency") -> str:
+    """
+    Formata uma matriz (adjacência ou incidência) para exibição com rótulos.
+    Monta o texto com write_matrix num buffer (tempo linear no tamanho da saída).
+    """
+    buffer = io.StringIO()
+    write_matrix(matrix, vertices, buffer, matrix_type)
+    return buffer.getvalue()
+
+def write_matrix_summary(matrix: Any, vertices: List[str], out: TextIO = None, matrix_type: str = "adjacency", top: int = 5) -> None:
+    """
+    Escreve um resumo da matriz em vez das células: dimensões, células não nulas, densidade,
+    estatísticas das somas das linhas (graus, na adjacência) e as top linhas de maior soma.
+    """
+    out = out if out is not None else sys.stdout
+    n = len(matrix)
+    n_cols = len(matrix[0]) if n else 0
+    if isinstance(matrix, MatrizGrafo):
+        somas, nao_nulos = matrix.resumo()
+    elif np is not None and isinstance(matrix, np.ndarray):
+        somas = matrix.sum(axis=1, dtype=np.int64).tolist()
+        nao_nulos = int(np.count_nonzero(matrix))
+    else:
+        somas = [sum(row) for row in matrix]
+        nao_nulos = sum(1 for row in matrix for val in row if val)
+    nome = "Adjacência" if matrix_type == "adjacency" else "Incidência"
+    out.write(f"Matriz de {nome}: {n} x {n_cols}\n")
+    out.write(f"Células não nulas: {nao_nulos}\n")
+    out.write(f"Densidade: {nao_nulos / (n * n_cols) if n and n_cols else 0.0:.4f}\n")
+    if somas:
+        rotulo = "Grau" if matrix_type == "adjacency" else "Soma da linha"
+        out.write(f"{rotulo}: mínimo {min(somas)}, máximo {max(somas)}, médio {sum(somas) / n:.2f}\n")
+        maiores = sorted(range(n), key=lambda i: -somas[i])[:top]
+        out.write(f"Top {len(maiores)} linhas: " + ", ".join(f"{vertices[i]} ({somas[i]})" for i in maiores) + "\n")
+
+def _formatar_vizinhos(vertex: Any, neighbors: List[Any], show_weights: bool, weights: Dict) -> str:
+    """Texto de uma linha da lista de adjacência (com pesos, se aplicável)."""
+    # Se não houver vizinhos
+    if not neighbors:
+        return " ∅"  # Símbolo para conjunto vazio
+    formatted_neighbors = []
+    for neighbor in neighbors:
+        if show_weights and weights:
+            weight = weights.get((vertex, neighbor)) or weights.get((neighbor, vertex))
+            if weight is not None:
+                formatted_neighbors.append(f"{neighbor}({weight:.1f})")
+            else:
+                formatted_neighbors.append(str(neighbor))
+        else:
+            formatted_neighbors.append(str(neighbor))
+    return " " + " ".join(formatted_neighbors)
+
+def write_adj_list(adj_list: Dict[Any, List[Any]], out: TextIO = None, show_weights: bool = False, weights: Dict = None,
+                   linhas: Tuple[int, int] = None) -> None:
+    """
+    Escreve a lista de adjacência em out, um vértice por linha, sem montar o texto inteiro.
+    linhas é uma janela (inicio, fim) opcional sobre os vértices, na ordem de adj_list.
+    """
+    out = out if out is not None else sys.stdout
+    if not adj_list:
+        out.write("Lista de adjacência vazia")
+        return
+    rows = _janela(len(adj_list), linhas)
+    vertices = list(adj_list.keys())[rows.start:rows.stop]
+    # Encontra o vértice com o nome mais longo para alinhar a saída
+    max_vertex_width = max((len(str(v)) for v in vertices), default=0)
+    for vertex in vertices:
+        out.write(f"{str(vertex):>{max_vertex_width}} |" + _formatar_vizinhos(vertex, adj_list[vertex], show_weights, weights) + "\n")
+    if len(rows) < len(adj_list):
+        out.write(f"... exibindo vértices {rows.start + 1}-{rows.stop} de {len(adj_list)}\n")
 
 def format_adj_list(adj_list: Dict[Any, List[Any]], show_weights: bool = False, weights: Dict = None) -> str:
     """
     Formata uma lista de adjacência para exibição.
     Se show_weights for True e weights for fornecido, mostra os pesos das arestas.
     """
-    if not adj_list:
-        return "Lista de adjacência vazia"
-    
-    # Encontra o vértice com o nome mais longo para alinhar a saída
-    max_vertex_width = max(len(str(v)) for v in adj_list.keys())
-    result = ""
-    
-    for vertex, neighbors in adj_list.items():
-        # Formata o vértice atual
-        result += f"{str(vertex):>{max_vertex_width}} |"
-        
-        # Se não houver vizinhos
-        if not neighbors:
-            result += " ∅"  # Símbolo para conjunto vazio
-        else:
-            # Formata cada vizinho (com peso, se aplicável)
-            formatted_neighbors = []
-            for neighbor in neighbors:
-                if show_weights and weights:
-                    weight = weights.get((vertex, neighbor)) or weights.get((neighbor, vertex))
-                    if weight is not None:
-                        formatted_neighbors.append(f"{neighbor}({weight:.1f})")
-                    else:
-                        formatted_neighbors.append(str(neighbor))
-                else:
-                    formatted_neighbors.append(str(neighbor))
-            
-            result += " " + " ".join(formatted_neighbors)
-        
-        result += "\n"
-    
-    return result
+    buffer = io.StringIO()
+    write_adj_list(adj_list, buffer, show_weights, weights)
+    return buffer.getvalue()
 
 # Exemplo de uso:
 if __name__ == "__main__":
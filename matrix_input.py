@@ -1,5 +1,14 @@
 from typing import List, Dict, Any, Tuple
-from main import Graph, adj_matrix_to_graph, incidence_matrix_to_graph, adj_list_to_graph
+import os
+from graph_input import abrir_arquivo
+from main import Graph, FrozenGraph, SparseIncidence, adj_matrix_to_graph, incidence_matrix_to_graph, adj_list_to_graph
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: apenas read_matrix_np depende dele
+    np = None
+
+LINHAS_POR_BLOCO = 1024
 
 def read_matrix_from_terminal(matrix_type: str = "adjacency") -> Tuple[List[List[int]], List[str]]:
     """
@@ -155,6 +164,126 @@ def read_matrix_from_file(filename: str, matrix_type: str = "adjacency") -> Tupl
     except ValueError as e:
         raise ValueError(f"Erro ao ler o arquivo: {e}")
 
+def _parse_bloco(linhas: List[bytes], cols: int, primeira: int):
+    """
+    Converte um bloco de linhas de texto da matriz em um ndarray uint8 (len(linhas) x cols).
+    Quando todas as entradas têm um único dígito (o caso comum 0/1/2) a conversão é feita
+    direto dos bytes; senão cada número é convertido e validado no intervalo 0..255.
+    """
+    tokens = b' '.join(linhas).split()
+    if len(tokens) != len(linhas) * cols:
+        for k, linha in enumerate(linhas):
+            if len(linha.split()) != cols:
+                raise ValueError(f"Cada linha deve ter {cols} números (linha {primeira + k} da matriz)")
+    digitos = b''.join(tokens)
+    if len(digitos) == len(tokens) and digitos.isdigit():
+        bloco = np.frombuffer(digitos, dtype=np.uint8) - ord('0')
+    else:
+        valores = np.array([int(x) for x in tokens], dtype=np.int64)
+        if valores.size and (valores.min() < 0 or valores.max() > 255):
+            raise ValueError(f"Valores da matriz devem estar entre 0 e 255 (linhas {primeira} a {primeira + len(linhas) - 1})")
+        bloco = valores.astype(np.uint8)
+    return bloco.reshape(len(linhas), cols)
+
+def _matriz_esparsa(A, matrix_type: str, vertices: List[str]):
+    """Converte a matriz densa A em FrozenGraph (adjacência, CSR) ou SparseIncidence (incidência)."""
+    if matrix_type == "adjacency":
+        return FrozenGraph.from_adj_array(A, vertices)
+    return SparseIncidence.from_dense(A, vertices)
+
+def _assinatura_fonte(filename: str) -> str:
+    """Tamanho e mtime (em ns) do arquivo de texto, gravados ao lado do .npy para saber se ele ainda vale."""
+    st = os.stat(filename)
+    return f"{st.st_size} {st.st_mtime_ns}"
+
+def _carregar_sidecar(filename: str, npy: str, shape: Tuple[int, int]):
+    """Mapeia o .npy em memória se a assinatura gravada bate com o texto atual; senão retorna None."""
+    try:
+        with open(npy + '.fonte', 'r', encoding='utf-8') as f:
+            if f.read().strip() != _assinatura_fonte(filename):
+                return None
+        A = np.load(npy, mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+    if A.shape != shape or A.dtype != np.uint8:
+        return None
+    return A
+
+def _remover_sidecar(npy: str) -> None:
+    """Apaga o .npy e sua assinatura (ignorando os que não existem ou não podem ser apagados)."""
+    for caminho in (npy + '.fonte', npy):
+        try:
+            os.remove(caminho)
+        except OSError:
+            pass
+
+def read_matrix_np(filename: str, matrix_type: str = "adjacency", sidecar: bool = False, densidade_esparsa: float = None, chunk_rows: int = LINHAS_POR_BLOCO):
+    """
+    Versão NumPy de read_matrix_from_file, para matrizes grandes (mesmo formato de arquivo).
+
+    - A matriz é lida em blocos de chunk_rows linhas direto para um ndarray uint8 (1 byte por
+      célula, em vez de um int do Python por célula).
+    - Com sidecar=True o ndarray é gravado em filename + '.npy' enquanto é lido, e o tamanho e o
+      mtime do texto em filename + '.npy.fonte'; nas leituras seguintes, se os dois ainda baterem,
+      o .npy é apenas mapeado em memória (np.load com mmap_mode='r'), sem reprocessar o texto.
+      Se o .npy não puder ser gravado (diretório somente leitura, disco cheio) a leitura segue
+      normalmente em memória, sem cache.
+    - Se densidade_esparsa for dado e a fração de células não nulas ficar abaixo dele, retorna a
+      forma esparsa: FrozenGraph (CSR) para adjacência ou SparseIncidence para incidência.
+
+    Retorna (matriz, vértices); a matriz pode ser passada direto para adj_matrix_to_graph ou
+    incidence_matrix_to_graph.
+    """
+    if np is None:
+        raise ImportError("NumPy não está instalado. Para instalar, execute: pip install numpy")
+    npy = filename + '.npy'
+    criado = False
+    try:
+        with open(filename, 'rb') as f:
+            vertices = f.readline().decode('utf-8').strip().split()
+            n = len(vertices)
+            cols = n if matrix_type == "adjacency" else int(f.readline().strip())
+
+            A = _carregar_sidecar(filename, npy, (n, cols)) if sidecar else None
+            if A is None:
+                if sidecar:
+                    try:
+                        # a assinatura antiga sai antes de o .npy ser reescrito
+                        _remover_sidecar(npy)
+                        A = np.lib.format.open_memmap(npy, mode='w+', dtype=np.uint8, shape=(n, cols))
+                        criado = True
+                    except OSError:
+                        A = None
+                if A is None:
+                    A = np.empty((n, cols), dtype=np.uint8)
+                lidas = 0
+                while lidas < n:
+                    linhas = [f.readline() for _ in range(min(chunk_rows, n - lidas))]
+                    A[lidas:lidas + len(linhas)] = _parse_bloco(linhas, cols, lidas + 1)
+                    lidas += len(linhas)
+                if criado:
+                    try:
+                        A.flush()
+                        with open(npy + '.fonte', 'w', encoding='utf-8') as fonte:
+                            fonte.write(_assinatura_fonte(filename))
+                        A = np.load(npy, mmap_mode='r')
+                    except OSError:
+                        # sem assinatura o .npy nunca é reaproveitado; A continua válido em memória
+                        _remover_sidecar(npy)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Arquivo não encontrado: {filename}")
+    except ValueError as e:
+        if criado:
+            # não deixa um .npy incompleto parecer válido na próxima leitura
+            _remover_sidecar(npy)
+        raise ValueError(f"Erro ao ler o arquivo: {e}")
+
+    if densidade_esparsa is not None and A.size:
+        nao_nulos = sum(int(np.count_nonzero(A[r0:r0 + chunk_rows])) for r0 in range(0, n, chunk_rows))
+        if nao_nulos < densidade_esparsa * A.size:
+            return _matriz_esparsa(A, matrix_type, vertices), vertices
+    return A, vertices
+
 def read_adj_list_from_file(filename: str) -> Dict[Any, List[Any]]:
     """
     Lê uma lista de adjacência de um arquivo.
@@ -167,7 +296,7 @@ def read_adj_list_from_file(filename: str) -> Dict[Any, List[Any]]:
     D:         # vizinhos de D (nenhum)
     """
     try:
-        with open(filename, 'r') as f:
+        with abrir_arquivo(filename) as f:
             # Lê os vértices
             vertices = f.readline().strip().split()
             vertex_set = set(vertices)
@@ -1,11 +1,11 @@
-from graph_input import read_graph_from_terminal, read_graph_from_file
-from matrix_input import (read_matrix_from_terminal, read_matrix_from_file,read_adj_list_from_terminal, read_adj_list_from_file)
-from matrix_display import format_matrix, format_adj_list
+from graph_input import read_graph_from_terminal, read_graph_from_file, read_adj_list_stream
+from matrix_input import (read_matrix_from_terminal, read_matrix_from_file,read_adj_list_from_terminal)
+from matrix_display import write_matrix, write_matrix_summary, write_adj_list, MatrizGrafo, LIMITE_EXIBICAO
 from main import (
-    convert_representation, visualize_graph, Graph, 
+    visualize_graph, Graph, graph_to_adj_list,
     adj_matrix_to_graph, incidence_matrix_to_graph, adj_list_to_graph,
     get_vertices_num, get_edge_num, get_adj_vertice, edge_exist,
-    get_degree, list_all_degrees, caminho_simples, ciclo_vertice,
+    get_degree, list_all_degrees, caminho_mais_curto, ciclo_vertice,
     is_subgraph
 )
 import os
@@ -32,8 +32,8 @@ def print_menu():
     print("13. Verificar existência de aresta")
     print("14. Verificar grau de um vértice")
     print("15. Listar graus de todos os vértices")
-    print("16. Encontrar caminho simples entre dois vértices")
-    print("17. Encontrar ciclo para um vértice")
+    print("16. Encontrar caminho mais curto entre dois vértices")
+    print("17. Encontrar ciclo mais curto para um vértice")
     print("18. Verificar subgrafo")
     print("0. Sair")
     print("===================")
@@ -77,6 +77,9 @@ def show_input_file_tutorial():
     print("- Use espaços para separar os elementos")
     print("- Pesos devem ser números decimais (use ponto, não vírgula)")
     print("- Cada aresta deve estar em uma nova linha")
+    print("\nTambém é aceita uma lista de arestas simples (sem as duas primeiras linhas):")
+    print("uma aresta por linha, separada por espaço, tab ou vírgula, com peso opcional")
+    print("na terceira coluna; linhas começando com # ou % são comentários")
     print("==========================================")
 
 def main():
@@ -143,11 +146,10 @@ def main():
                 
                 else:  # Lista de adjacência
                     if input_choice == '1':
-                        adj_list = read_adj_list_from_terminal()
+                        graph = adj_list_to_graph(read_adj_list_from_terminal())
                     else:
                         filename = input("\nDigite o nome do arquivo: ").strip()
-                        adj_list = read_adj_list_from_file(filename)
-                    graph = adj_list_to_graph(adj_list)
+                        graph = read_adj_list_stream(filename)
                 
                 print("\nGrafo criado com sucesso!")
             
@@ -167,20 +169,32 @@ def main():
                 if graph is None:
                     print("\nNenhum grafo foi inserido ainda!")
                 else:
-                    representations = convert_representation(graph, 'graph')
+                    # só a representação pedida; as matrizes são lidas célula a célula (MatrizGrafo),
+                    # então grafos grandes mostram o resumo + a primeira janela sem montar V x V / V x E
+                    janela = (0, LIMITE_EXIBICAO)
+                    grande = len(graph.vertices) > LIMITE_EXIBICAO
                     if choice == '7':
                         print("\nMatriz de Adjacência:")
-                        print(format_matrix(representations['adj_matrix'], 
-                                         graph.vertices, "adjacency"))
+                        matriz = MatrizGrafo(graph, "adjacency")
+                        if grande:
+                            write_matrix_summary(matriz, graph.vertices, matrix_type="adjacency")
+                        write_matrix(matriz, graph.vertices, matrix_type="adjacency",
+                                     linhas=janela if grande else None, colunas=janela if grande else None)
                     elif choice == '8':
                         print("\nMatriz de Incidência:")
-                        print(format_matrix(representations['incidence'], 
-                                         graph.vertices, "incidence"))
+                        matriz = MatrizGrafo(graph, "incidence")
+                        grande = grande or len(graph.edges) > LIMITE_EXIBICAO
+                        if grande:
+                            write_matrix_summary(matriz, graph.vertices, matrix_type="incidence")
+                        write_matrix(matriz, graph.vertices, matrix_type="incidence",
+                                     linhas=janela if grande else None, colunas=janela if grande else None)
                     else:  # choice == '9'
                         print("\nLista de Adjacência:")
-                        print(format_adj_list(representations['adj_list'],
-                                           True if hasattr(graph, 'weights') else False,
-                                           graph.weights if hasattr(graph, 'weights') else None))
+                        write_adj_list(graph.cached('adj_list', lambda: graph_to_adj_list(graph)),
+                                       show_weights=True if hasattr(graph, 'weights') else False,
+                                       weights=graph.weights if hasattr(graph, 'weights') else None,
+                                       linhas=janela if grande else None)
+                    print()
             
             elif choice == '10':  # Número de vértices
                 if graph is None:
@@ -245,7 +259,7 @@ def main():
                     for v, g in graus.items():
                         print(f"  {v}: {g}")
 
-            elif choice == '16':  # Caminho simples
+            elif choice == '16':  # Caminho mais curto (BFS)
                 if graph is None:
                     print("\nNenhum grafo foi inserido ainda!")
                 else:
@@ -255,9 +269,9 @@ def main():
                     if v1 not in graph.vertices or v2 not in graph.vertices:
                         print("\nUm ou mais vértices não encontrados!")
                     else:
-                        caminho = caminho_simples([], v1, v2, g=graph)
+                        caminho = caminho_mais_curto(v1, v2, g=graph)
                         if caminho:
-                            print(f"\nCaminho encontrado: {' -> '.join(caminho)}")
+                            print(f"\nCaminho encontrado ({len(caminho) - 1} arestas): {' -> '.join(map(str, caminho))}")
                         else:
                             print(f"\nNão existe caminho entre {v1} e {v2}")
 
@@ -272,7 +286,7 @@ def main():
                     else:
                         ciclo = ciclo_vertice(vertice, g=graph)
                         if ciclo:
-                            print(f"\nCiclo encontrado: {' -> '.join(ciclo)}")
+                            print(f"\nCiclo mais curto encontrado ({len(ciclo) - 1} arestas): {' -> '.join(map(str, ciclo))}")
                         else:
                             print(f"\nNão existe ciclo para o vértice {vertice}")
 
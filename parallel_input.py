@@ -0,0 +1,128 @@
+"""
+parallel_input.py
+Leitura paralela de grafos divididos em vários arquivos (shards).
+
+Cada arquivo é processado por um processo do pool:
+- o worker lê o arquivo em fluxo (graph_input.iter_edge_list ou iter_adj_list, inclusive
+  compactado) e interna os rótulos numa tabela local;
+- devolve só dados compactos: a lista de rótulos e as arestas como arrays de ids locais
+  (array 'i'), com os pesos num array 'd' (NaN = sem peso), já sem duplicatas locais
+  (uma aresta repetida só atualiza o peso, como em Graph.add_edge).
+O processo principal interna só os rótulos de cada arquivo, remapeia os arrays de ids locais
+para ids globais, arquivo por arquivo e na ordem da lista de arquivos (o resultado não depende
+da ordem em que os workers terminam), e insere as arestas por id num único Graph
+(Graph._add_edges_by_id), que descarta as duplicatas entre arquivos comparando ids inteiros.
+
+Em Windows/macOS (spawn) a chamada deve ficar sob `if __name__ == '__main__':`.
+"""
+
+from typing import Any, Dict, List, Tuple
+from array import array
+from itertools import chain
+from multiprocessing import Pool
+import os
+import time
+from main import Graph, LabelTable
+from graph_input import abrir_arquivo, iter_edge_list, iter_adj_list
+
+FORMATOS = ("arestas", "lista")
+
+
+def _arestas_lista(linhas, intern):
+    """Arestas (v, w) de uma lista de adjacência, internando também os vértices sem vizinhos."""
+    for v, vizinhos in iter_adj_list(linhas):
+        intern(v)
+        for w in vizinhos:
+            yield v, w
+
+
+def _ler_shard(tarefa: Tuple[str, str, bool]) -> Tuple[List[Any], bytes, bytes, bytes]:
+    """
+    Worker: lê um arquivo e retorna (rótulos, heads, tails, pesos) com as arestas em ids locais.
+    heads/tails/pesos são os bytes de arrays 'i', 'i' e 'd' (pesos vazio se não houver nenhum).
+    """
+    filename, formato, weighted = tarefa
+    tabela = LabelTable()
+    intern = tabela.intern
+    heads, tails, pesos = array('i'), array('i'), array('d')
+    posicao = {}
+    tem_peso = False
+    try:
+        with abrir_arquivo(filename) as f:
+            if formato == "arestas":
+                arestas = iter_edge_list(f, weighted)
+            else:
+                primeira = f.readline()
+                if ':' in primeira:
+                    linhas = chain([primeira], f)
+                else:
+                    # cabeçalho com os vértices (não valida: os vizinhos podem estar em outros shards)
+                    for v in primeira.split():
+                        intern(v)
+                    linhas = f
+                arestas = _arestas_lista(linhas, intern)
+            for edge in arestas:
+                i, j = intern(edge[0]), intern(edge[1])
+                chave = (i, j) if i <= j else (j, i)
+                k = posicao.get(chave)
+                if k is not None:
+                    # aresta repetida: como em Graph.add_edge, só atualiza o peso
+                    if len(edge) == 3:
+                        pesos[k] = edge[2]
+                        tem_peso = True
+                    continue
+                posicao[chave] = len(heads)
+                heads.append(i)
+                tails.append(j)
+                if len(edge) == 3:
+                    pesos.append(edge[2])
+                    tem_peso = True
+                else:
+                    pesos.append(float('nan'))
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Arquivo não encontrado: {filename}")
+    except ValueError as e:
+        raise ValueError(f"Erro ao ler o arquivo {filename}: {e}")
+    return tabela.labels, heads.tobytes(), tails.tobytes(), pesos.tobytes() if tem_peso else b''
+
+
+def read_files_parallel(filenames: List[str], formato: str = "arestas", weighted: bool = None,
+                        processes: int = None, stats: Dict[str, Any] = None) -> Graph:
+    """
+    Lê vários arquivos em paralelo e junta tudo num único Graph.
+    formato: "arestas" (lista de arestas, ver graph_input.read_edge_list) ou
+             "lista" (lista de adjacência, ver graph_input.read_adj_list_stream)
+    processes: número de processos (padrão: número de CPUs, limitado ao número de arquivos);
+               com 1 processo ou 1 arquivo tudo roda no processo atual, sem pool.
+    stats: se for um dict, recebe 'arquivos', 'arestas_lidas' (após a deduplicação local),
+           'tempo_leitura' e 'tempo_juncao' (s).
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato desconhecido: {formato}")
+    tarefas = [(filename, formato, weighted) for filename in filenames]
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = max(1, min(processes, len(tarefas)))
+
+    inicio = time.perf_counter()
+    if processes == 1:
+        resultados = [_ler_shard(t) for t in tarefas]
+    else:
+        with Pool(processes) as pool:
+            resultados = pool.map(_ler_shard, tarefas)
+    meio = time.perf_counter()
+
+    g = Graph([], [])
+    lidas = 0
+    for rotulos, heads_b, tails_b, pesos_b in resultados:
+        # ids locais -> globais: cada rótulo é procurado uma vez por arquivo, não uma vez por aresta
+        global_ids = [g._intern(v) for v in rotulos]
+        heads = [global_ids[a] for a in array('i', heads_b)]
+        tails = [global_ids[b] for b in array('i', tails_b)]
+        lidas += len(heads)
+        g._add_edges_by_id(heads, tails, array('d', pesos_b) if pesos_b else None)
+
+    if stats is not None:
+        stats.update(arquivos = len(tarefas), arestas_lidas = lidas,
+                     tempo_leitura = meio - inicio, tempo_juncao = time.perf_counter() - meio)
+    return g